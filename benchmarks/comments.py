@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Benchmark comment lines removal
+
+Usage: python benchmarks/comments.py [n_lines]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import tempfile
+import timeit
+
+import pandas
+
+from pyannote.parser import MDTMParser
+
+import generate
+
+
+def rowwise(df):
+    # comment removal as done up to pyannote.parser 0.8
+    keep = [not all(pandas.isnull(item) for item in row[1:])
+            for row in df.itertuples()]
+    return df[keep]
+
+
+def columnwise(df):
+    return df[df.notnull().any(axis=1).values]
+
+
+if __name__ == '__main__':
+
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    _, path = tempfile.mkstemp(suffix='.mdtm')
+    generate.mdtm(path, n_lines, comments=0.2)
+
+    parser = MDTMParser()
+    df = parser._read_table(path)
+
+    for name, func in [('row-wise', rowwise), ('column-wise', columnwise)]:
+        duration = min(timeit.repeat(lambda: func(df), number=1, repeat=3))
+        print('{name:>12s}: {duration:.3f}s'.format(name=name,
+                                                    duration=duration))
+
+    duration = min(timeit.repeat(lambda: parser.read(path), number=1,
+                                 repeat=3))
+    print('{name:>12s}: {duration:.3f}s'.format(name='MDTM read',
+                                                duration=duration))
+
+    os.remove(path)
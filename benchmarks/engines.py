@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Benchmark tokenizer engines
+
+Usage: python benchmarks/engines.py [n_lines]
+"""
+
+from __future__ import print_function
+
+import importlib.util
+import os
+import sys
+import tempfile
+import timeit
+
+import pandas.testing
+
+from pyannote.parser import MDTMParser
+
+import generate
+
+
+if __name__ == '__main__':
+
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    _, path = tempfile.mkstemp(suffix='.mdtm')
+    generate.mdtm(path, n_lines, comments=0.01)
+
+    parser = MDTMParser()
+
+    engines = ['c', 'python']
+    if importlib.util.find_spec('pyarrow') is None:
+        print('pyarrow is not installed')
+    else:
+        engines.insert(1, 'pyarrow')
+
+    # all engines must tokenize the file the same way
+    expected = parser._read_table(path, engine='c')
+    for engine in engines[1:]:
+        pandas.testing.assert_frame_equal(
+            parser._read_table(path, engine=engine), expected)
+
+    for engine in engines:
+
+        tokenize = min(timeit.repeat(
+            lambda: parser._read_table(path, engine=engine),
+            number=1, repeat=3))
+
+        read = min(timeit.repeat(
+            lambda: parser.read(path, engine=engine, lazy=True),
+            number=1, repeat=3))
+
+        print('{engine:>8s}: {tokenize:.3f}s (tokenize) / '
+              '{read:.3f}s (lazy read)'.format(engine=engine,
+                                               tokenize=tokenize, read=read))
+
+    os.remove(path)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Synthetic files used by benchmarks"""
+
+from __future__ import print_function
+
+import random
+
+
+def mdtm(path, n_lines, n_uris=100, comments=0., grouped=False, seed=0):
+    """Generate a synthetic MDTM file
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    n_lines : int
+        Number of (non-comment) lines.
+    n_uris : int, optional
+        Number of resources. Defaults to 100.
+    comments : float, optional
+        Ratio of ';;' comment lines interleaved with regular lines.
+        Defaults to no comment.
+    grouped : bool, optional
+        Write resources one after the other. Defaults to interleaved
+        resources.
+    seed : int, optional
+        Random seed.
+    """
+
+    generator = random.Random(seed)
+
+    with open(path, 'w') as f:
+        for i in range(n_lines):
+
+            if comments and generator.random() < comments:
+                f.write(';; comment line #{i:d}\n'.format(i=i))
+
+            if grouped:
+                uri = i * n_uris // n_lines
+            else:
+                uri = generator.randrange(n_uris)
+
+            f.write('uri{uri:d} 1 {start:.3f} {duration:.3f} {modality} NA '
+                    '{gender} spk{label:d}\n'.format(
+                        uri=uri,
+                        start=1000 * generator.random(),
+                        duration=0.01 + 10 * generator.random(),
+                        modality=generator.choice(['speaker', 'speech']),
+                        gender=generator.choice(['male', 'female']),
+                        label=generator.randrange(50)))
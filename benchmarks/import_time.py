@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Benchmark import time
+
+Usage: python benchmarks/import_time.py [repeat]
+
+Each statement is run in a fresh interpreter.
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+import timeit
+
+STATEMENTS = [
+    'pass',
+    'import pyannote.parser',
+    'from pyannote.parser import LSTParser',
+    'from pyannote.parser import MDTMParser',
+    'from pyannote.parser import MagicParser; '
+    'MagicParser.get_parser("uem")',
+]
+
+
+if __name__ == '__main__':
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for statement in STATEMENTS:
+        duration = min(timeit.repeat(
+            lambda: subprocess.check_call([sys.executable, '-c', statement]),
+            number=1, repeat=repeat))
+        print('{duration:.3f}s  {statement}'.format(duration=duration,
+                                                   statement=statement))
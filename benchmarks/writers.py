@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Benchmark `write_columns` against a plain loop writing one line per entry
+
+Usage: python benchmarks/writers.py [n_lines]
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import sys
+import tempfile
+import timeit
+
+from pyannote.core.segment import SEGMENT_PRECISION
+from pyannote.parser import MDTMParser, REPEREParser, UEMParser
+
+import generate
+
+
+def mdtm(columns, f, uri, modality):
+    format = '%s 1 %%g %%g %s NA %%s %%s\n' % (uri, modality)
+    for start, end, track, label in zip(columns['start'], columns['end'],
+                                        columns['track'], columns['label']):
+        duration = end - start if end - start > SEGMENT_PRECISION else 0.
+        f.write(format % (start, duration, track, label))
+
+
+def repere(columns, f, uri, modality):
+    format = '%s %%g %%g %s %%s\n' % (uri, modality)
+    for start, end, label in zip(columns['start'], columns['end'],
+                                 columns['label']):
+        f.write(format % (start, end, label))
+
+
+def uem(columns, f, uri):
+    format = '%s 1 %%g %%g\n' % (uri)
+    for start, end in zip(columns['start'], columns['end']):
+        f.write(format % (start, end))
+
+
+def compare(name, per_line, write_columns, expected):
+
+    outputs = []
+    durations = []
+    for write in [per_line, write_columns]:
+        f = io.StringIO()
+        durations.append(min(timeit.repeat(
+            lambda: write(f), setup=lambda: (f.seek(0), f.truncate()),
+            number=1, repeat=3)))
+        outputs.append(f.getvalue())
+
+    assert outputs[0] == outputs[1], 'outputs differ'
+    assert outputs[1] == expected, 'output differs from `write`'
+
+    print('{name:>8s}: {per_line:.3f}s (per line) / '
+          '{columns:.3f}s (write_columns)'.format(
+              name=name, per_line=durations[0], columns=durations[1]))
+
+
+def written(parser, obj):
+    f = io.StringIO()
+    parser.write(obj, f)
+    return f.getvalue()
+
+
+if __name__ == '__main__':
+
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    # all lines in one single annotation
+    _, path = tempfile.mkstemp(suffix='.mdtm')
+    generate.mdtm(path, n_lines, n_uris=1)
+    annotation = MDTMParser().read(path)(uri='uri0', modality='speaker')
+    os.remove(path)
+
+    columns = {'start': [], 'end': [], 'track': [], 'label': []}
+    for segment, track, label in annotation.itertracks(yield_label=True):
+        columns['start'].append(segment.start)
+        columns['end'].append(segment.end)
+        columns['track'].append(track)
+        columns['label'].append(label)
+
+    compare('mdtm',
+            lambda f: mdtm(columns, f, 'uri0', 'speaker'),
+            lambda f: MDTMParser().write_columns(
+                columns, f, uri='uri0', modality='speaker'),
+            written(MDTMParser(), annotation))
+
+    compare('repere',
+            lambda f: repere(columns, f, 'uri0', 'speaker'),
+            lambda f: REPEREParser().write_columns(
+                columns, f, uri='uri0', modality='speaker'),
+            written(REPEREParser(), annotation))
+
+    timeline = annotation.get_timeline()
+    segments = {'start': [segment.start for segment in timeline],
+                'end': [segment.end for segment in timeline]}
+    compare('uem',
+            lambda f: uem(segments, f, 'uri0'),
+            lambda f: UEMParser().write_columns(segments, f, uri='uri0'),
+            written(UEMParser(), timeline))
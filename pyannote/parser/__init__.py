@@ -32,65 +32,81 @@ from ._version import get_versions
 __version__ = get_versions()['version']
 del get_versions
 
+import io
 import os
 import sys
-from pkg_resources import iter_entry_points
 
+from pyannote.parser.compression import strip_compression, open_buffer, \
+    BUFFERS
+from pyannote.parser.plugins import ParserPlugins as _ParserPlugins
 
-__all__ = []
+# file extension to parser class mapping
+# (parser modules are only imported once one of their extensions is used)
+ParserPlugins = _ParserPlugins()
 
-ParserPlugins = {}
 
-# iterate over parser plugins
-for o in iter_entry_points(group='pyannote.parser.plugin', name=None):
+def __getattr__(name):
+    """Import parser classes at package root upon first access
 
-    # obtain parser class name (e.g. "MDTMParser")
-    parser_name = o.name
-
-    # obtain parser class (e.g. MDTMParser)
-    parser_class = o.load()
+    (e.g. pyannote.parser.MDTMParser)
+    """
 
-    # iterate over supported file extensions
-    # (e.g. ['mdtm'] for MDTMParser)
-    for extension in parser_class.file_extensions():
+    # make sure parser classes are imported with
+    # >>> from pyannote.parser import *
+    if name == '__all__':
+        return ParserPlugins.names + [str('MagicParser')]
 
-        # if extension is already registered by another parser plugin
-        # raise an exception
-        if extension in ParserPlugins:
+    try:
+        Parser = ParserPlugins.load(name)
+    except KeyError:
+        msg = "module '{m}' has no attribute '{a}'"
+        raise AttributeError(msg.format(m=__name__, a=name))
 
-            msg = 'Extension {e} is registered by both {p1} and {p2}'
-            raise ValueError(
-                msg.format(
-                    e=extension,
-                    p1=parser_class.__name__,
-                    p2=ParserPlugins[extension].__name__))
+    globals()[name] = Parser
+    return Parser
 
-        # otherwise, register the extension with the parser class
-        ParserPlugins[extension] = parser_class
 
-    # import parser class at package root
-    # (e.g. pyannote.parser.MDTMParser)
-    setattr(sys.modules[__name__], parser_name, parser_class)
+def _read_store(task):
+    """Read one file into a ColumnStore (run by MagicParser.read_many workers)
 
-    # make sure parser class is imported with
-    # >>> from pyannote.parser import *
-    __all__.append(parser_name)
+    Returns
+    -------
+    path : str
+    store : ColumnStore or None
+    error : Exception or None
+    """
+    Parser, init_kwargs, path, kwargs = task
+    try:
+        store = Parser(**init_kwargs)._read_store(path, **kwargs)
+    except Exception as e:
+        return path, None, e
+    return path, store, None
 
 
 class MagicParser(object):
     """Magic parser chooses which parser to use based on file extension
 
+    Parameters
+    ----------
+    memory : MemoryCache, optional
+        Cache files read with `read` in memory, so that reading an unchanged
+        file again returns the very same parser (which must therefore not be
+        modified in place). Defaults to reading files every time.
+
     Notes
     -----
     kwargs are passed to selected parser
 
+    Streams are parsed according to their guessed file format (see
+    `sniff_parser`).
+
     """
 
     @staticmethod
     def get_parser(extension):
         try:
             Parser = ParserPlugins[extension]
-        except Exception:
+        except KeyError:
             msg = 'Extension "{e}" is not supported.'
             raise NotImplementedError(msg.format(e=extension))
         return Parser
@@ -98,33 +114,209 @@ class MagicParser(object):
     @staticmethod
     def guess_parser(path):
 
-        # obtain file extension (without leading .)
-        _, extension = os.path.splitext(path)
+        # obtain file extension (without leading . nor compression suffix)
+        # e.g. 'mdtm' for /path/to/file.mdtm.gz
+        _, extension = os.path.splitext(strip_compression(path))
         extension = extension[1:]
 
         return MagicParser.get_parser(extension)
 
-    def __init__(self, **kwargs):
+    @staticmethod
+    def sniff_parser(f):
+        """Guess parser from the first lines of binary stream `f`
+
+        Returns
+        -------
+        Parser : type
+        f : binary file-like
+            Stream to be parsed instead of `f` (its first lines were
+            consumed by sniffing).
+        """
+
+        from pyannote.parser.sniff import sniff
+
+        f, extension = sniff(f)
+        if extension is None:
+            raise NotImplementedError('Could not guess file format.')
+
+        return MagicParser.get_parser(extension), f
+
+    def __init__(self, memory=None, **kwargs):
         super(MagicParser, self).__init__()
+        self.memory = memory
         self.init_kwargs = kwargs
 
-    def read(self, path, **kwargs):
+    def read(self, path, sniff=False, **kwargs):
+        """
+
+        Parameters
+        ----------
+        path : str, binary file-like, bytes or memoryview
+            Path to file, stream or file contents. Use '-' to read standard
+            input.
+        sniff : bool, optional
+            Guess file format from the first lines of the file rather than
+            from its extension (e.g. for files without extension). Defaults
+            to doing so only for streams. Sniffed files are parsed as
+            streams.
+        """
+
+        if isinstance(path, BUFFERS):
+            path = open_buffer(path)
+        elif path == '-':
+            path = sys.stdin.buffer
+
+        # stream to parse instead of `path`
+        f = None
+        # file opened for sniffing
+        opened = None
+
+        Parser = None
+        if hasattr(path, 'read'):
+            Parser, f = self.sniff_parser(path)
+            path = None
+        elif not sniff:
+            Parser = self.guess_parser(path)
 
-        # obtain file extension (without leading .)
-        _, extension = os.path.splitext(path)
-        extension = extension[1:]
+        try:
 
-        # obtain parser based on the extension
-        Parser = self.get_parser(extension)
+            if Parser is None:
+                opened = io.open(path, 'rb')
+                Parser, f = self.sniff_parser(opened)
 
-        # initialize parser
-        parser = Parser(**self.init_kwargs)
+            # return cached parser if file has not changed since last read
+            memory = self.memory
+            key = None
+            if memory is not None and path is not None:
+                key = memory.key(path, Parser, self.init_kwargs, kwargs)
+            if key is not None:
+                parser = memory.get(key)
+                if parser is not None:
+                    return parser
+
+            # initialize parser
+            parser = Parser(**self.init_kwargs)
+
+            # read file
+            parser.read(path if f is None else f, **kwargs)
 
-        # read file
-        parser.read(path, **kwargs)
+        finally:
+            if f is not None:
+                f.close()
+            if opened is not None:
+                opened.close()
+
+        if key is not None:
+            memory.put(key, parser)
 
         # return parser with file loaded internally
         return parser
 
+    def read_many(self, paths, workers=None, lazy=True, **kwargs):
+        """Read many files (sharing the same file format) in parallel
+
+        Each file is parsed by a worker process into a compact column-wise
+        representation. All of them are then merged into one parser.
+
+        Parameters
+        ----------
+        paths : iterable
+            Paths to files. Their file format must be supported by a tabular
+            parser (e.g. MDTM, UEM, REPERE). Paths to the same file are only
+            read once.
+        workers : int, optional
+            Number of worker processes. Defaults to the number of CPUs.
+            Use workers=1 to read files in the current process.
+        lazy : bool, optional
+            Build each annotation the first time it is requested (default),
+            rather than all of them at once.
+
+        Returns
+        -------
+        parser : TabularParser
+            Parser with all files loaded internally (None if none of the
+            files has a supported file format). Entries of a given
+            (uri, modality) pair found in several files are concatenated
+            (see `TabularParser.extend`).
+        failures : dict
+            Path to exception dictionary, for files that could not be read
+            (including files whose format differs from that of most files).
+
+        Notes
+        -----
+        kwargs are passed to the `read` method of the selected parser (all
+        its options but `lazy` and `append` are supported).
+        """
+
+        import inspect
+        from collections import Counter
+        from concurrent.futures import ProcessPoolExecutor
+        from pyannote.parser.tabular import TabularParser
+        from pyannote.parser.store import LazyLoaded
+
+        # check options once rather than failing in every worker
+        supported = inspect.signature(TabularParser._read_store).parameters
+        unsupported = sorted(set(kwargs) - set(supported) - {'self', 'path'})
+        if unsupported:
+            msg = 'read_many does not support option(s) {o}.'
+            raise TypeError(msg.format(o=', '.join(unsupported)))
+
+        failures = {}
+
+        # obtain parser based on file extensions
+        Parsers = {}
+        read = set()
+        for path in paths:
+            if os.path.abspath(path) in read:
+                continue
+            read.add(os.path.abspath(path))
+            try:
+                Parsers[path] = self.guess_parser(path)
+            except NotImplementedError as e:
+                failures[path] = e
+
+        # files must share the same (most common) file format
+        Parser = None
+        if Parsers:
+            Parser, _ = Counter(Parsers.values()).most_common(1)[0]
+
+        for path, Other in list(Parsers.items()):
+            if Other is not Parser:
+                msg = 'File format ({p}) differs from most files ({o}).'
+                failures[path] = ValueError(msg.format(
+                    p=Other.__name__, o=Parser.__name__))
+                del Parsers[path]
+            elif not issubclass(Parser, TabularParser):
+                msg = '{p} does not support reading many files.'
+                failures[path] = NotImplementedError(
+                    msg.format(p=Parser.__name__))
+                del Parsers[path]
+
+        if not Parsers:
+            return None, failures
+
+        tasks = [(Parser, self.init_kwargs, path, kwargs) for path in Parsers]
+
+        if workers == 1:
+            results = [_read_store(task) for task in tasks]
+        else:
+            workers = workers or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    _read_store, tasks,
+                    chunksize=max(1, len(tasks) // (4 * workers))))
+
+        parser = Parser(**self.init_kwargs)
+
+        parser._loaded = LazyLoaded(build=parser._build)
+        for path, store, error in results:
+            if error is None:
+                parser._merge(store)
+            else:
+                failures[path] = error
+
+        if not lazy:
+            parser._loaded = dict(parser._loaded)
+
+        return parser, failures
 
-__all__.append(str('MagicParser'))
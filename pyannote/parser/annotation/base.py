@@ -26,69 +26,25 @@
 # AUTHORS
 # Hervé BREDIN - http://herve.niderb.fr
 
-from abc import abstractmethod
-from pyannote.parser.base import Parser
+from pyannote.parser.tabular import TabularParser
 
-from pyannote.core import Annotation
-from pyannote.core import PYANNOTE_URI, PYANNOTE_MODALITY, \
-    PYANNOTE_SEGMENT, PYANNOTE_TRACK, PYANNOTE_LABEL
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_MODALITY, \
+    PYANNOTE_TRACK, PYANNOTE_LABEL
 
-import pandas
+import numpy
 
 
-class AnnotationParser(Parser):
+class AnnotationParser(TabularParser):
 
-    @abstractmethod
-    def fields(self):
-        pass
+    def dtype(self):
+        return {PYANNOTE_URI: object,
+                PYANNOTE_LABEL: object}
 
-    @abstractmethod
-    def get_segment(self, row):
-        pass
-
-    def converters(self):
-        return None
-
-    def comment(self):
-        return None
-
-    def read(self, path, uri=None, modality=None, **kwargs):
-        """
-
-        Parameters
-        ----------
-        path : str
-
-        modality : str, optional
-            Force all entries to be considered as coming from this modality.
-            Only taken into account when file format does not provide
-            any field related to modality (e.g. .seg files)
-
-        """
-
-        # load whole file
-        df = pandas.read_table(path,
-                               delim_whitespace=True,
-                               header=None, names=self.fields(),
-                               comment=self.comment(),
-                               converters=self.converters(),
-                               dtype={PYANNOTE_URI: object,
-                                      PYANNOTE_LABEL: object},
-                               keep_default_na=False, na_values=[])
-
-        # remove comment lines
-        # (i.e. lines for which all fields are either None or NaN)
-        keep = [not all(pandas.isnull(item) for item in row[1:])
-                for row in df.itertuples()]
-        df = df[keep]
-
-        # add 'segment' column build from start time & duration
-        df[PYANNOTE_SEGMENT] = [self.get_segment(row)
-                                for row in df.itertuples()]
+    def _complete(self, df, uri=None, modality=None, offset=0):
 
         # add unique track numbers if they are not read from file
         if PYANNOTE_TRACK not in self.fields():
-            df[PYANNOTE_TRACK] = range(df.shape[0])
+            df[PYANNOTE_TRACK] = offset + numpy.arange(df.shape[0])
 
         # add uri column in case it does not exist
         if PYANNOTE_URI not in df:
@@ -96,38 +52,30 @@ class AnnotationParser(Parser):
                 raise ValueError('missing uri -- use uri=')
             df[PYANNOTE_URI] = uri
 
-        # obtain list of resources
-        uris = list(df[PYANNOTE_URI].unique())
-
         # add modality column in case it does not exist
         if PYANNOTE_MODALITY not in df:
             if modality is None:
                 raise ValueError('missing modality -- use modality=')
-            df[PYANNOTE_MODALITY] = modality if modality is not None else ""
-
-        # obtain list of modalities
-        modalities = list(df[PYANNOTE_MODALITY].unique())
+            df[PYANNOTE_MODALITY] = modality
 
-        self._loaded = {}
+        return df
 
-        # loop on resources
-        for uri in uris:
+    def _columns(self):
+        return ['start', 'end', PYANNOTE_TRACK, PYANNOTE_LABEL]
 
-            # filter based on resource
-            df_ = df[df[PYANNOTE_URI] == uri]
-
-            # loop on modalities
-            for modality in modalities:
-
-                # filter based on modality
-                modality = modality if modality is not None else ""
-                df__ = df_[df_[PYANNOTE_MODALITY] == modality]
-                a = Annotation.from_df(df__, modality=modality, uri=uri)
-                self._loaded[uri, modality] = a
-
-        return self
+    def _build(self, columns, uri=None, modality=None):
+        """Build annotation from 'start', 'end', 'track' and 'label' columns"""
+        from pyannote.core import Annotation, Segment
+        annotation = Annotation(uri=uri, modality=modality)
+        for start, end, track, label in zip(columns['start'].tolist(),
+                                            columns['end'].tolist(),
+                                            columns[PYANNOTE_TRACK].tolist(),
+                                            columns[PYANNOTE_LABEL].tolist()):
+            annotation[Segment(start, end), track] = label
+        return annotation
 
     def empty(self, uri=None, modality=None, **kwargs):
+        from pyannote.core import Annotation
         return Annotation(uri=uri, modality=modality)
 
     def write(self, annotation, f, uri=None, modality=None):
@@ -150,5 +98,45 @@ class AnnotationParser(Parser):
 
         self._append(annotation, f, uri, modality)
 
+    def write_columns(self, columns, f, uri=None, modality=None):
+        """Write entries given column-wise
+
+        Parameters
+        ----------
+        columns : dict or pandas.DataFrame
+            'start', 'end' and 'label' columns, and optional 'track', 'uri'
+            and 'modality' columns.
+        f : file handle
+        uri, modality : str, optional
+            Used when `columns` has no 'uri' (resp. 'modality') column.
+        """
+
+        columns = {name: columns.get(name, default) for name, default in [
+            (PYANNOTE_URI, uri), (PYANNOTE_MODALITY, modality),
+            ('start', None), ('end', None),
+            (PYANNOTE_TRACK, 'NA'), (PYANNOTE_LABEL, None)]}
+
+        self._write_columns(f, {name: self._as_column(values)
+                                for name, values in columns.items()})
+
     def _append(self, annotation, f, uri, modality):
         raise NotImplementedError('')
+
+    def _write_columns(self, f, columns):
+        """Write entries
+
+        Parameters
+        ----------
+        f : file handle
+        columns : dict
+            'uri', 'modality', 'start', 'end', 'track' and 'label' lists
+            (or single values shared by all entries).
+        """
+        raise NotImplementedError('')
+
+    @staticmethod
+    def _duration(start, end):
+        """Same as Segment(start, end).duration, for lists of start and end"""
+        from pyannote.core.segment import SEGMENT_PRECISION
+        return [e - s if e - s > SEGMENT_PRECISION else 0.
+                for s, e in zip(start, end)]
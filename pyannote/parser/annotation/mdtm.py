@@ -29,8 +29,8 @@
 from __future__ import unicode_literals
 from __future__ import print_function
 
-from pyannote.core import Segment
-from pyannote.core import PYANNOTE_URI, PYANNOTE_MODALITY, PYANNOTE_LABEL
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_MODALITY, \
+    PYANNOTE_TRACK, PYANNOTE_LABEL
 
 from .base import AnnotationParser
 
@@ -59,15 +59,24 @@ class MDTMParser(AnnotationParser):
         return ';'
 
     def get_segment(self, row):
+        from pyannote.core import Segment
         return Segment(row[3], row[3] + row[4])
 
-    def _append(self, annotation, f, uri, modality):
+    def get_start_end(self, df):
+        start = df['start'].values
+        return start, start + df['duration'].values
 
-        try:
-            format = '%s 1 %%g %%g %s NA %%s %%s\n' % (uri, modality)
-            for segment, track, label in annotation.itertracks(label=True):
-                f.write(format % (segment.start, segment.duration,
-                                  track, label))
-        except Exception as e:
-            print("Error @ %s%s %s %s" % (uri, segment, track, label))
-            raise e
+    def _append(self, annotation, f, uri, modality):
+        format = '%s 1 %%g %%g %s NA %%s %%s\n' % (self._escape(uri),
+                                                  self._escape(modality))
+        for segment, track, label in annotation.itertracks(yield_label=True):
+            f.write(format % (segment.start, segment.duration, track, label))
+
+    def _write_columns(self, f, columns):
+        self._write_lines(f, '%s 1 %g %g %s NA %s %s\n', [
+            columns[PYANNOTE_URI],
+            columns['start'],
+            self._duration(columns['start'], columns['end']),
+            columns[PYANNOTE_MODALITY],
+            columns[PYANNOTE_TRACK],
+            columns[PYANNOTE_LABEL]])
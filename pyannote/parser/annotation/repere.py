@@ -29,8 +29,8 @@
 from __future__ import unicode_literals
 from __future__ import print_function
 
-from pyannote.core import Segment
-from pyannote.core import PYANNOTE_URI, PYANNOTE_MODALITY, PYANNOTE_LABEL
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_MODALITY, \
+    PYANNOTE_LABEL
 
 from .base import AnnotationParser
 
@@ -56,18 +56,25 @@ class REPEREParser(AnnotationParser):
         return None
 
     def get_segment(self, row):
+        from pyannote.core import Segment
         return Segment(row[2], row[3])
 
-    def _append(self, annotation, f, uri, modality):
-
-        try:
-            format = '%s %%g %%g %s %%s\n' % (uri, modality)
-            for segment, track, label in annotation.itertracks(label=True):
-                f.write(format % (segment.start, segment.end, label))
+    def get_start_end(self, df):
+        return df['start'].values, df['end'].values
 
-        except Exception as e:
-            print("Error @ %s%s %s %s" % (uri, segment, track, label))
-            raise e
+    def _append(self, annotation, f, uri, modality):
+        format = '%s %%g %%g %s %%s\n' % (self._escape(uri),
+                                         self._escape(modality))
+        for segment, track, label in annotation.itertracks(yield_label=True):
+            f.write(format % (segment.start, segment.end, label))
+
+    def _write_columns(self, f, columns):
+        self._write_lines(f, '%s %g %g %s %s\n', [
+            columns[PYANNOTE_URI],
+            columns['start'],
+            columns['end'],
+            columns[PYANNOTE_MODALITY],
+            columns[PYANNOTE_LABEL]])
 
     @staticmethod
     def get_show_name(uri):
@@ -30,8 +30,7 @@ from __future__ import unicode_literals
 from __future__ import print_function
 from __future__ import division
 
-from pyannote.core import Segment
-from pyannote.core import PYANNOTE_URI, PYANNOTE_LABEL
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_LABEL
 
 from .base import AnnotationParser
 
@@ -55,6 +54,11 @@ class SEGParser(AnnotationParser):
         return '#'
 
     def get_segment(self, row):
+        from pyannote.core import Segment
         return Segment(
             row[4] / 100,
             (row[4] + row[5]) / 100)
+
+    def get_start_end(self, df):
+        start = df['start'].values
+        return start / 100, (start + df['duration'].values) / 100
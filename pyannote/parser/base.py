@@ -28,9 +28,15 @@
 
 from __future__ import unicode_literals
 
-import six
 from abc import ABCMeta, abstractmethod
 
+# same values as pyannote.core constants, defined here so that importing a
+# parser module does not import pyannote.core
+PYANNOTE_URI = 'uri'
+PYANNOTE_MODALITY = 'modality'
+PYANNOTE_TRACK = 'track'
+PYANNOTE_LABEL = 'label'
+
 
 class Parser(object):
 
@@ -49,40 +55,144 @@ class Parser(object):
     def empty(self, uri=None, modality=None, **kwargs):
         pass
 
+    @property
+    def _loaded(self):
+        return self.__loaded
+
+    @_loaded.setter
+    def _loaded(self, loaded):
+        self.__loaded = loaded
+        self.__index = None
+        self.__uris = None
+        self.__modalities = None
+
+    def _index(self):
+        """Get secondary indexes of loaded (uri, modality) keys
+
+        Built upon first call after `_loaded` is set.
+
+        Returns
+        -------
+        by_uri, by_modality : dict
+            uri (resp. modality) to list of (uri, modality) keys dictionary.
+        """
+
+        if self.__index is None:
+            self.__index = {}, {}
+            self._indexed(self._loaded)
+
+        return self.__index
+
+    def _indexed(self, keys):
+        """Update secondary indexes with keys newly added to `_loaded`"""
+
+        if self.__index is None:
+            return
+
+        by_uri, by_modality = self.__index
+        for key in keys:
+            uri, modality = key
+            if uri not in by_uri:
+                self.__uris = None
+            if modality not in by_modality:
+                self.__modalities = None
+            same_uri = by_uri.setdefault(uri, [])
+            if key not in same_uri:
+                same_uri.append(key)
+                by_modality.setdefault(modality, []).append(key)
+
     def __get_uris(self):
-        return sorted(set([v for (v, m) in self._loaded]))
+        if self.__uris is None:
+            self.__uris = tuple(sorted(self._index()[0]))
+        return self.__uris
     uris = property(fget=__get_uris)
-    """"""
+    """Sorted tuple of loaded resources"""
 
     def __get_modalities(self):
-        return sorted(set([m for (v, m) in self._loaded]))
+        if self.__modalities is None:
+            self.__modalities = tuple(sorted(self._index()[1]))
+        return self.__modalities
     modalities = property(fget=__get_modalities)
-    """"""
+    """Sorted tuple of loaded modalities"""
 
     def __call__(self, uri=None, modality=None, **kwargs):
 
-        match = dict(self._loaded)
+        # only look at annotations of the requested resource and/or modality
+        if uri is not None and modality is not None:
+            key = (uri, modality)
+            match = [key] if key in self._loaded else []
+
+        elif uri is not None:
+            match = self._index()[0].get(uri, [])
 
-        # filter out all annotations
-        # but the ones for the requested resource
-        if uri is not None:
-            match = {(v, m): ann for (v, m), ann in six.iteritems(match)
-                     if v == uri}
+        elif modality is not None:
+            match = self._index()[1].get(modality, [])
 
-        # filter out all remaining annotations
-        # but the ones for the requested modality
-        if modality is not None:
-            match = {(v, m): ann for (v, m), ann in six.iteritems(match)
-                     if m == modality}
+        else:
+            match = list(self._loaded)
 
         if len(match) == 0:
             A = self.empty(uri=uri, modality=modality, **kwargs)
 
         elif len(match) == 1:
-            A = list(match.values())[0]
+            A = self._loaded[match[0]]
 
         else:
             msg = 'Found more than one matching annotation: %s'
-            raise ValueError(msg % match.keys())
+            raise ValueError(msg % match)
 
         return A
+
+    def batch(self, uris, modality=None, shared_empty=False, **kwargs):
+        """Get annotations of many resources at once
+
+        Same as [self(uri=uri, modality=modality) for uri in uris], only
+        faster.
+
+        Parameters
+        ----------
+        uris : iterable
+        modality : str, optional
+        shared_empty : bool, optional
+            Use one single empty instance (with no uri) for all resources
+            without any entry. It must then not be modified in place.
+            Defaults to one new empty instance per resource.
+
+        Returns
+        -------
+        annotations : list
+            One annotation per requested resource, in the same order.
+        """
+
+        loaded = self._loaded
+        by_uri, _ = self._index()
+
+        if shared_empty:
+            empty = self.empty(modality=modality, **kwargs)
+
+        annotations = []
+        for uri in uris:
+
+            if modality is None:
+                match = by_uri.get(uri, [])
+            else:
+                key = (uri, modality)
+                match = [key] if key in loaded else []
+
+            if len(match) == 1:
+                annotations.append(loaded[match[0]])
+
+            elif len(match) == 0:
+                annotations.append(
+                    empty if shared_empty else
+                    self.empty(uri=uri, modality=modality, **kwargs))
+
+            else:
+                msg = 'Found more than one matching annotation: %s'
+                raise ValueError(msg % match)
+
+        return annotations
+
+    def items(self):
+        """Iterate over loaded ((uri, modality), annotation) pairs"""
+        return iter(self._loaded.items())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""On-disk cache of parsed files"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+from pyannote.parser.store import ColumnStore
+
+
+class ParseCache(object):
+    """On-disk cache of parsed files
+
+    Each entry is a `ColumnStore` saved as .npy files in its own
+    sub-directory, and memory-mapped when loaded back.
+
+    Parameters
+    ----------
+    directory : str
+        Cache directory. Created if it does not exist.
+    size : int, optional
+        Maximum size of the cache, in bytes. Least recently used entries are
+        evicted when it is exceeded. Defaults to 1GB.
+    """
+
+    # bump whenever the on-disk layout changes
+    VERSION = 1
+
+    def __init__(self, directory, size=2 ** 30):
+        super(ParseCache, self).__init__()
+        self.directory = os.path.expanduser(directory)
+        self.size = size
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def key(self, path, parser, **kwargs):
+        """Cache key of `path` parsed by `parser` with `kwargs` options
+
+        Depends on path, size and modification time of the file, on the
+        parser class and on the options.
+        """
+        stat = os.stat(path)
+        identity = [self.VERSION,
+                    os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                    type(parser).__module__, type(parser).__name__,
+                    sorted(kwargs.items())]
+        return hashlib.sha1(
+            json.dumps(identity, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Get (memory-mapped) store, or None in case of cache miss"""
+        directory = os.path.join(self.directory, key)
+        try:
+            store = ColumnStore.load(directory, mmap_mode='r')
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        # mark entry as recently used
+        os.utime(directory, None)
+        return store
+
+    def put(self, key, store):
+        """Add store to the cache (and evict old entries if needed)"""
+
+        directory = os.path.join(self.directory, key)
+        temporary = tempfile.mkdtemp(dir=self.directory, prefix='.')
+
+        try:
+            store.save(temporary)
+            os.rename(temporary, directory)
+        except (IOError, OSError, ValueError):
+            # non-cacheable store, or entry added concurrently
+            shutil.rmtree(temporary, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until cache fits in `size`"""
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                continue
+            directory = os.path.join(self.directory, name)
+            size = sum(os.path.getsize(os.path.join(directory, f))
+                       for f in os.listdir(directory))
+            entries.append((os.path.getmtime(directory), size, directory))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, directory in sorted(entries):
+            if total <= self.size:
+                break
+            shutil.rmtree(directory, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name),
+                          ignore_errors=True)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Transparent compression of files, based on their suffix
+
+zstd compression requires the optional `zstandard` package.
+"""
+
+import io
+import os
+import bz2
+import gzip
+import lzma
+
+# file suffix to compression
+SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+
+# in-memory file contents
+BUFFERS = (bytes, bytearray, memoryview)
+
+
+def infer_compression(path):
+    """Get compression of `path` from its suffix (None if not compressed)"""
+    _, suffix = os.path.splitext(str(path))
+    return SUFFIXES.get(suffix.lower())
+
+
+def strip_compression(path):
+    """Remove compression suffix (if any) from `path`
+
+    >>> strip_compression('/path/to/file.mdtm.gz')
+    '/path/to/file.mdtm'
+    """
+    if infer_compression(path) is None:
+        return path
+    root, _ = os.path.splitext(path)
+    return root
+
+
+class _MemoryReader(io.RawIOBase):
+    """Binary stream reading from a buffer, without copying it upfront"""
+
+    def __init__(self, buffer):
+        super(_MemoryReader, self).__init__()
+        self._buffer = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._position = max(0, offset)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def readinto(self, b):
+        data = self._buffer[self._position:self._position + len(b)]
+        b[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class _Borrowed(object):
+    """File object proxy that leaves the original file open when closed"""
+
+    def __init__(self, f):
+        super(_Borrowed, self).__init__()
+        self._f = f
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __iter__(self):
+        return iter(self._f)
+
+    @property
+    def mode(self):
+        # e.g. gzip files have integer modes
+        mode = getattr(self._f, 'mode', None)
+        if isinstance(mode, str):
+            return mode
+        return 'r' if isinstance(self._f, io.TextIOBase) else 'rb'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._f.writable():
+            self._f.flush()
+
+
+def borrow(f):
+    """Get proxy of file `f` that leaves it open when closed"""
+    return _Borrowed(f)
+
+
+def open_buffer(buffer):
+    """Get binary stream reading from `buffer` (bytes or memoryview)"""
+    # BytesIO shares (rather than copies) the memory of bytes objects
+    if type(buffer) is bytes:
+        return io.BytesIO(buffer)
+    return io.BufferedReader(_MemoryReader(buffer))
+
+
+def open_file(path, mode='r', compression='infer', encoding='utf-8'):
+    """Open (possibly compressed) file
+
+    Parameters
+    ----------
+    path : str, file-like, bytes or memoryview
+        Already opened files (binary or text) are left open when the
+        returned file is closed. Compression of file-like objects and
+        buffers cannot be inferred: it must be given explicitly.
+    mode : str, optional
+        Same as built-in `open`. Defaults to reading text.
+    compression : {'infer', 'gzip', 'bz2', 'xz', 'zstd', None}, optional
+        Defaults to inferring compression from `path` suffix.
+    encoding : str, optional
+        Used in text mode. Defaults to 'utf-8'.
+    """
+
+    binary = 'b' in mode
+
+    if isinstance(path, BUFFERS):
+        path = open_buffer(path)
+        is_file = True
+    elif hasattr(path, 'read') or hasattr(path, 'write'):
+        if isinstance(path, io.TextIOBase):
+            if not binary and compression in ('infer', None):
+                return _Borrowed(path)
+            if not hasattr(path, 'buffer'):
+                raise ValueError('cannot read bytes from a text buffer')
+            path = path.buffer
+        path = _Borrowed(path)
+        is_file = True
+    else:
+        is_file = False
+
+    if compression == 'infer':
+        compression = None if is_file else infer_compression(path)
+
+    mode = mode.replace('t', '').replace('b', '')
+
+    if compression is None:
+        f = path if is_file else io.open(path, mode + 'b')
+    elif compression == 'gzip':
+        # same default level as gzip command line tool (4x faster than
+        # Python default level for barely larger files)
+        f = gzip.open(path, mode + 'b', compresslevel=6)
+    elif compression == 'bz2':
+        f = bz2.open(path, mode + 'b')
+    elif compression == 'xz':
+        f = lzma.open(path, mode + 'b')
+    elif compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('zstd compression requires zstandard')
+        f = zstandard.open(path, mode + 'b')
+    else:
+        raise ValueError('unsupported compression "%s"' % compression)
+
+    return f if binary else io.TextIOWrapper(f, encoding=encoding)
@@ -29,7 +29,7 @@
 from __future__ import unicode_literals
 
 from pyannote.parser.base import Parser
-import pyannote.core.json
+from pyannote.parser.compression import open_file
 
 
 class JSONParser(Parser):
@@ -40,7 +40,8 @@ class JSONParser(Parser):
         return ['json']
 
     def read(self, path, **kwargs):
-        with open(path, 'r') as fp:
+        import pyannote.core.json
+        with open_file(path, 'r') as fp:
             self._loaded = pyannote.core.json.load(fp)
         return self
 
@@ -28,7 +28,130 @@
 
 from __future__ import unicode_literals
 
+import re
+import mmap
+from collections.abc import Sequence
+
 from pyannote.parser.base import Parser
+from pyannote.parser.compression import open_file, infer_compression, \
+    BUFFERS
+
+
+class MappedLines(Sequence):
+    """Stripped lines of a memory-mapped file, decoded upon access
+
+    Only the offset of each line is kept in memory, as an array of 4 (or 8,
+    for files larger than 4GB) bytes per line.
+
+    Parameters
+    ----------
+    path : str, bytes or memoryview
+        Path to (uncompressed) file, or file contents.
+    index : bool, optional
+        Build a hash index of lines (16 more bytes per line) so that
+        membership tests (`line in lines`) do not search the whole file.
+
+    Notes
+    -----
+    Slicing returns a list.
+    """
+
+    def __init__(self, path, index=False):
+        super(MappedLines, self).__init__()
+
+        import numpy
+
+        if isinstance(path, BUFFERS):
+            buffer = path
+        elif infer_compression(path) is not None:
+            raise ValueError('cannot memory-map compressed file "%s"' % path)
+        else:
+            with open(path, 'rb') as f:
+                # empty files cannot be memory-mapped
+                try:
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    buffer = b''
+
+        self._buffer = memoryview(buffer).cast('B')
+        size = len(self._buffer)
+
+        # line i is _buffer[_offsets[i]:_offsets[i + 1] - 1]
+        data = numpy.frombuffer(self._buffer, dtype=numpy.uint8)
+        chunksize = 2 ** 26
+        starts = numpy.concatenate(
+            [[0]] + [numpy.flatnonzero(data[i:i + chunksize] == 10) + i + 1
+                     for i in range(0, size, chunksize)])
+        if size and starts[-1] != size:
+            # last line has no trailing newline
+            starts = numpy.r_[starts, size + 1]
+        dtype = numpy.uint32 if size < 2 ** 32 - 1 else numpy.int64
+        self._offsets = starts.astype(dtype)
+
+        self._hashes = None
+        if index:
+            self._index()
+
+    def _index(self):
+        """Build sorted array of line hashes (and corresponding lines)"""
+        import numpy
+        hashes = numpy.fromiter((hash(line) for line in self),
+                                dtype=numpy.int64, count=len(self))
+        self._order = numpy.argsort(hashes, kind='stable')
+        self._hashes = hashes[self._order]
+
+    def _line(self, start, stop):
+        return str(self._buffer[start:stop - 1], 'utf-8').strip()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('line index out of range')
+        return self._line(int(self._offsets[i]), int(self._offsets[i + 1]))
+
+    def __iter__(self):
+        # convert offsets to Python integers one block at a time
+        blocksize = 2 ** 16
+        for i in range(0, len(self), blocksize):
+            offsets = self._offsets[i:i + blocksize + 1].tolist()
+            for start, stop in zip(offsets[:-1], offsets[1:]):
+                yield self._line(start, stop)
+
+    def __contains__(self, line):
+
+        if not isinstance(line, str):
+            return False
+
+        if self._hashes is None:
+            # only lines including (encoded) `line` may be equal to it
+            pattern = re.compile(re.escape(line.encode('utf-8')))
+            position = 0
+            while True:
+                match = pattern.search(self._buffer, position)
+                # (`position` may be past the end of the buffer)
+                if match is None or match.start() < position:
+                    return False
+                i = int(self._offsets.searchsorted(
+                    match.start(), side='right')) - 1
+                if i >= len(self):
+                    return False
+                if self[i] == line:
+                    return True
+                position = int(self._offsets[i + 1])
+
+        h = hash(line)
+        i = int(self._hashes.searchsorted(h))
+        while i < len(self._hashes) and self._hashes[i] == h:
+            if self[int(self._order[i])] == line:
+                return True
+            i += 1
+        return False
 
 
 class LSTParser(Parser):
@@ -44,22 +167,32 @@ class LSTParser(Parser):
     def empty(self, **kwargs):
         raise NotImplementedError()
 
-    def read(self, path, **kwargs):
+    def read(self, path, mmap=False, index=False, **kwargs):
         """
 
         Parameters
         ----------
-        path : str
-            Path to list file (.lst)
+        path : str, file-like, bytes or memoryview
+            Path to list file (.lst), already opened file or file contents
+        mmap : bool, optional
+            Memory-map the file and only decode lines upon access, instead
+            of loading all of them in memory. Not supported for compressed
+            files nor file-like objects.
+        index : bool, optional
+            When `mmap` is True, build a hash index of lines for fast
+            membership tests (see `MappedLines`).
 
         Returns
         -------
-        lines : list
+        lines : list or MappedLines
             List of stripped lines
         """
 
-        with open(path, 'r') as f:
-            lines = [line.strip() for line in f]
+        if mmap:
+            lines = MappedLines(path, index=index)
+        else:
+            with open_file(path, 'r') as f:
+                lines = [line.strip() for line in f]
 
         self._loaded = lines
 
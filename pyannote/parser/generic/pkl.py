@@ -32,6 +32,7 @@ from __future__ import unicode_literals
 import pickle
 
 from pyannote.parser.base import Parser
+from pyannote.parser.compression import open_file
 
 
 class PKLParser(Parser):
@@ -42,7 +43,7 @@ class PKLParser(Parser):
 
     def read(self, path, **kwargs):
 
-        with open(path, 'rb') as f:
+        with open_file(path, 'rb') as f:
             data = pickle.load(f)
 
         self._loaded = data
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""In-process cache of parsed files"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class MemoryCache(object):
+    """In-process cache of parsers, with least recently used eviction
+
+    Parameters
+    ----------
+    entries : int, optional
+        Maximum number of cached parsers. Defaults to 32.
+    size : int, optional
+        Maximum total size of cached files (as measured on disk), in bytes.
+        Defaults to 256MB.
+
+    Notes
+    -----
+    Cached parsers (and the annotations they return) are shared by all
+    readers of the same file: they must not be modified in place (e.g. with
+    `extend` or `read(..., append=True)`).
+
+    `size` bounds the size of files, not the memory used by their parsers.
+    In particular, lazy parsers keep growing as annotations get built.
+    """
+
+    def __init__(self, entries=32, size=2 ** 28):
+        super(MemoryCache, self).__init__()
+        self.entries = entries
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        # key to (parser, size) dictionary, least recently used first
+        self._parsers = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path, Parser, init_kwargs, kwargs):
+        """Cache key of `path` read by `Parser` with given options
+
+        Depends on path, size and modification time of the file, on the
+        parser class and on the options. None when `path` is not an existing
+        file (e.g. a file object), in which case it cannot be cached.
+        """
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                Parser, repr(sorted(init_kwargs.items())),
+                repr(sorted(kwargs.items())))
+
+    def get(self, key):
+        """Get cached parser, or None in case of cache miss"""
+        with self._lock:
+            try:
+                parser, _ = self._parsers[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._parsers.move_to_end(key)
+            self.hits += 1
+            return parser
+
+    def put(self, key, parser):
+        """Add parser to the cache, evicting least recently used ones"""
+        size = key[1]
+        if size > self.size or self.entries < 1:
+            return
+        with self._lock:
+            self._discard(key)
+            self._parsers[key] = (parser, size)
+            self._size += size
+            while len(self._parsers) > self.entries or self._size > self.size:
+                self._discard(next(iter(self._parsers)))
+
+    def _discard(self, key):
+        _, size = self._parsers.pop(key, (None, 0))
+        self._size -= size
+
+    def invalidate(self, path=None):
+        """Remove every cached version of `path` (or everything)"""
+        with self._lock:
+            if path is None:
+                self._parsers.clear()
+                self._size = 0
+                return
+            path = os.path.abspath(path)
+            for key in [key for key in self._parsers if key[0] == path]:
+                self._discard(key)
+
+    def __len__(self):
+        return len(self._parsers)
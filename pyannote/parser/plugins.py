@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Lazy discovery of parser plugins
+
+Parser plugins are registered in the 'pyannote.parser.plugin' entry point
+group (e.g. MDTMParser=pyannote.parser.annotation.mdtm:MDTMParser).
+
+They may also declare their file extensions in the
+'pyannote.parser.extension' entry point group (e.g.
+mdtm=pyannote.parser.annotation.mdtm:MDTMParser), so that a parser module
+is only imported once one of its extensions is actually requested.
+Plugins that do not declare their extensions are imported upon first lookup.
+"""
+
+from collections.abc import Mapping
+
+
+PLUGIN_GROUP = 'pyannote.parser.plugin'
+EXTENSION_GROUP = 'pyannote.parser.extension'
+
+
+def entry_points(group):
+    """Get entry points of a given group (without importing them)"""
+
+    try:
+        from importlib.metadata import entry_points as _entry_points
+    except ImportError:  # Python < 3.8
+        from importlib_metadata import entry_points as _entry_points
+
+    eps = _entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+class ParserPlugins(Mapping):
+    """File extension to parser class mapping, built lazily
+
+    Raises
+    ------
+    ValueError
+        (upon first lookup) when an extension is registered by more than
+        one parser.
+    """
+
+    def __init__(self):
+        super(ParserPlugins, self).__init__()
+        # parser name to entry point value (e.g. 'module:Parser')
+        self._names = None
+        # entry point value to entry point
+        self._entry_points = None
+        # extension to entry point value
+        self._extensions = None
+        # entry point value to parser class
+        self._classes = {}
+
+    def _scan(self):
+        """Read entry point metadata (without importing anything)"""
+
+        if self._entry_points is not None:
+            return
+
+        plugins = entry_points(PLUGIN_GROUP)
+        extensions = entry_points(EXTENSION_GROUP)
+
+        self._names = {ep.name: ep.value for ep in plugins}
+        self._entry_points = {ep.value: ep for ep in extensions + plugins}
+        self._declared = [(ep.name, ep.value) for ep in extensions]
+
+    @staticmethod
+    def _register(extensions, extension, value):
+        registered = extensions.setdefault(extension, value)
+        if registered != value:
+            msg = 'Extension {e} is registered by both {p1} and {p2}'
+            raise ValueError(msg.format(e=extension,
+                                        p1=value.split(':')[-1],
+                                        p2=registered.split(':')[-1]))
+
+    def _discover(self):
+        """Map extensions to entry points"""
+
+        if self._extensions is not None:
+            return
+
+        self._scan()
+
+        # (only kept once complete, so that every lookup raises ValueError
+        # in case of duplicate extensions)
+        extensions = {}
+        for extension, value in self._declared:
+            self._register(extensions, extension, value)
+
+        # plugins that do not declare their extensions have to be imported
+        declared = set(extensions.values())
+        for value in sorted(set(self._names.values()) - declared):
+            for extension in self._load(value).file_extensions():
+                self._register(extensions, extension, value)
+
+        self._extensions = extensions
+
+    def _load(self, value):
+        try:
+            return self._classes[value]
+        except KeyError:
+            Parser = self._entry_points[value].load()
+            self._classes[value] = Parser
+            return Parser
+
+    @property
+    def names(self):
+        """Names of parser classes (e.g. 'MDTMParser')"""
+        self._scan()
+        return sorted(self._names)
+
+    def load(self, name):
+        """Import parser class by its name (e.g. 'MDTMParser')"""
+        self._scan()
+        return self._load(self._names[name])
+
+    def __getitem__(self, extension):
+        self._discover()
+        return self._load(self._extensions[extension])
+
+    def __iter__(self):
+        self._discover()
+        return iter(self._extensions)
+
+    def __len__(self):
+        self._discover()
+        return len(self._extensions)
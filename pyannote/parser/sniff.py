@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Guess file format of streams (e.g. stdin) from their first lines
+
+>>> f, extension = sniff(sys.stdin.buffer)
+>>> MagicParser.get_parser(extension)().read(f)
+"""
+
+import io
+import codecs
+
+from pyannote.parser.compression import open_file
+
+# leading bytes to compression
+MAGIC = [(b'\x1f\x8b', 'gzip'),
+         (b'BZh', 'bz2'),
+         (b'\xfd7zXZ\x00', 'xz'),
+         (b'\x28\xb5\x2f\xfd', 'zstd')]
+
+
+class _Replay(io.RawIOBase):
+    """Binary stream that replays `prefix` before reading the rest of `f`"""
+
+    def __init__(self, prefix, f):
+        super(_Replay, self).__init__()
+        self._prefix = memoryview(prefix)
+        self._f = f
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._prefix:
+            n = min(len(b), len(self._prefix))
+            b[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = getattr(self._f, 'read1', self._f.read)(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+def peek(f, size=2 ** 16, lines=20):
+    """Read the first bytes of binary stream `f` without consuming them
+
+    Reading stops after `size` bytes or `lines` lines, whichever comes
+    first, so that slow pipes are not waited for longer than needed.
+
+    Returns
+    -------
+    prefix : bytes
+    f : binary file-like
+        Stream yielding `prefix` followed by the rest of the original
+        stream (which is not closed when this one is).
+    """
+    read = getattr(f, 'read1', f.read)
+    chunks = []
+    n_bytes = n_lines = 0
+    while n_bytes < size and n_lines < lines:
+        chunk = read(size - n_bytes)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n_bytes += len(chunk)
+        n_lines += chunk.count(b'\n')
+    prefix = b''.join(chunks)
+    return prefix, io.BufferedReader(_Replay(prefix, f), 2 ** 16)
+
+
+def sniff_compression(prefix):
+    """Get compression from the first bytes of a stream (None if none)"""
+    for magic, compression in MAGIC:
+        if prefix.startswith(magic):
+            return compression
+    return None
+
+
+def _is_number(token, integer=False):
+    try:
+        int(token) if integer else float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _line_format(tokens):
+    """Guess file format of one (tokenized, non-comment) line"""
+
+    n = len(tokens)
+
+    # uri channel start duration modality confidence gender label
+    if n == 8 and _is_number(tokens[2]) and _is_number(tokens[3]):
+        return 'mdtm'
+
+    # uri label channel start duration (in centiseconds)
+    if n == 5 and _is_number(tokens[3], integer=True) \
+            and _is_number(tokens[4], integer=True) \
+            and not _is_number(tokens[1]):
+        return 'seg'
+
+    # uri start end modality label
+    if n == 5 and _is_number(tokens[1]) and _is_number(tokens[2]):
+        return 'repere'
+
+    # uri channel start end
+    if n == 4 and _is_number(tokens[2]) and _is_number(tokens[3]):
+        return 'uem'
+
+    # one thing per line
+    if n == 1:
+        return 'lst'
+
+    return None
+
+
+def sniff_format(prefix):
+    """Guess file format (as a file extension) from the first bytes of a file
+
+    Parameters
+    ----------
+    prefix : bytes
+        First bytes of the (uncompressed) file. Its last line is ignored
+        when it may have been truncated (unless it is the only one).
+
+    Returns
+    -------
+    extension : str
+        One of 'mdtm', 'repere', 'seg', 'uem', 'json', 'trs' or 'lst'.
+        None when `prefix` is not UTF-8 text, or when some lines do not
+        look like any supported file format (or not like the same one).
+    """
+
+    # (a multi-byte character may have been truncated at the end)
+    try:
+        text = codecs.getincrementaldecoder('utf-8')().decode(prefix)
+    except UnicodeDecodeError:
+        return None
+    if '\x00' in text:
+        return None
+
+    start = text.lstrip()[:1]
+    if start in ('{', '['):
+        return 'json'
+    if start == '<':
+        return 'trs'
+
+    lines = text.splitlines()
+    if len(lines) > 1 and not text.endswith('\n'):
+        lines = lines[:-1]
+
+    formats = set()
+    for line in lines:
+        tokens = line.split()
+        # skip blank and comment lines
+        if not tokens or tokens[0][0] in ';#':
+            continue
+        formats.add(_line_format(tokens))
+
+    if len(formats) == 1 and None not in formats:
+        return formats.pop()
+    return None
+
+
+def sniff(f):
+    """Guess file format of binary stream `f` from its first lines
+
+    Compressed streams are decompressed on the fly.
+
+    Returns
+    -------
+    f : binary file-like
+        Stream to be read instead of `f` (from the beginning).
+    extension : str
+        Guessed file format (see `sniff_format`), or None.
+    """
+
+    if isinstance(f, io.TextIOBase):
+        f = open_file(f, 'rb')
+
+    prefix, f = peek(f)
+
+    compression = sniff_compression(prefix)
+    if compression is not None:
+        f = open_file(f, 'rb', compression=compression)
+        prefix, f = peek(f)
+
+    return f, sniff_format(prefix)
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Column-wise storage of parsed entries"""
+
+import os
+import json
+from collections.abc import Mapping
+
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_MODALITY
+
+import numpy
+
+
+class ColumnStore(object):
+    """Entries stored column-wise and grouped by (uri, modality)
+
+    Parameters
+    ----------
+    columns : dict
+        Column name to numpy.ndarray dictionary, sorted by group.
+    groups : dict
+        (uri, modality) to (start, stop) dictionary, such that entries of a
+        given group are columns[name][start:stop].
+    categories : dict, optional
+        Column name to array of unique values, for columns stored as integer
+        codes into this array.
+    """
+
+    def __init__(self, columns, groups, categories=None):
+        super(ColumnStore, self).__init__()
+        self.columns = columns
+        self.groups = groups
+        self.categories = {} if categories is None else categories
+
+    @classmethod
+    def from_df(cls, df, columns):
+        """Partition data frame by (uri, modality)
+
+        Rows are sorted once by group (keeping file order within each group)
+        so that each group is a contiguous slice of the sorted columns.
+        Only (uri, modality) pairs that actually occur are stored.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data frame with 'uri' (and optionally 'modality') columns.
+            `modality` is None when `df` has no 'modality' column.
+        columns : list
+            Columns to store. Those with object dtype (e.g. labels) are
+            stored as integer codes.
+        """
+
+        import pandas
+
+        if not len(df):
+            return cls({column: numpy.empty((0, )) for column in columns},
+                       {})
+
+        by = [PYANNOTE_URI]
+        if PYANNOTE_MODALITY in df:
+            by.append(PYANNOTE_MODALITY)
+
+        # one integer code per group, in order of first appearance
+        codes = df.groupby(by, sort=False, dropna=False).ngroup().values
+        order = numpy.argsort(codes, kind='stable')
+        codes = codes[order]
+
+        boundaries = numpy.flatnonzero(numpy.diff(codes)) + 1
+        starts = numpy.r_[0, boundaries]
+        stops = numpy.r_[boundaries, len(df)]
+
+        uris = df[PYANNOTE_URI].values[order[starts]]
+        if PYANNOTE_MODALITY in df:
+            modalities = df[PYANNOTE_MODALITY].values[order[starts]]
+        else:
+            modalities = [None] * len(starts)
+
+        groups = {(uri, modality): (start, stop) for uri, modality, start, stop
+                  in zip(uris, modalities, starts.tolist(), stops.tolist())}
+
+        stored = {}
+        categories = {}
+        for column in columns:
+            values = df[column].values[order]
+            if values.dtype == object:
+                values, categories[column] = pandas.factorize(values)
+                values = values.astype(numpy.int32)
+            stored[column] = values
+
+        return cls(stored, groups, categories=categories)
+
+    def subset(self, keys):
+        """Get store restricted to `keys` groups (columns are shared)"""
+        groups = {key: self.groups[key] for key in keys if key in self.groups}
+        return self.__class__(self.columns, groups,
+                              categories=self.categories)
+
+    def isin(self, column, values):
+        """Get boolean mask of entries whose `column` value is in `values`
+
+        Categorical columns are tested once per category.
+        """
+        import pandas
+
+        if column in self.categories:
+            found = pandas.Index(self.categories[column]).isin(list(values))
+            return found[self.columns[column]]
+        return pandas.Series(self.columns[column]).isin(list(values)).values
+
+    def take(self, mask):
+        """Get store restricted to entries where `mask` is True
+
+        Entries that do not belong to any group are dropped as well, and so
+        are groups left empty.
+        """
+
+        keep = numpy.zeros(len(mask), dtype=bool)
+        for start, stop in self.groups.values():
+            keep[start:stop] = mask[start:stop]
+
+        # new (start, stop) boundaries of each group
+        keys = list(self.groups)
+        bounds = numpy.array([self.groups[key] for key in keys],
+                             dtype=numpy.int64).reshape((-1, 2))
+        bounds = numpy.r_[0, numpy.cumsum(keep)][bounds].tolist()
+
+        groups = {key: (start, stop)
+                  for key, (start, stop) in zip(keys, bounds) if stop > start}
+
+        columns = {column: values[keep]
+                   for column, values in self.columns.items()}
+
+        return self.__class__(columns, groups, categories=self.categories)
+
+    def save(self, directory):
+        """Save store as one .npy file per column in (existing) `directory`
+
+        Raises
+        ------
+        ValueError
+            When a categorical column has non-string categories.
+        """
+
+        import pandas
+
+        for column, categories in self.categories.items():
+            if pandas.api.types.infer_dtype(categories,
+                                            skipna=False) != 'string':
+                msg = 'cannot save non-string categories of "%s" column'
+                raise ValueError(msg % column)
+
+        keys = list(self.groups)
+        numpy.save(os.path.join(directory, 'groups.npy'),
+                   numpy.array([self.groups[key] for key in keys],
+                               dtype=numpy.int64).reshape((-1, 2)))
+        numpy.save(os.path.join(directory, 'uris.npy'),
+                   numpy.array([uri for uri, _ in keys], dtype=str))
+        numpy.save(os.path.join(directory, 'modalities.npy'),
+                   numpy.array(['' if modality is None else modality
+                                for _, modality in keys], dtype=str))
+
+        for column, values in self.columns.items():
+            numpy.save(os.path.join(directory, 'column.%s.npy' % column),
+                       values)
+
+        for column, categories in self.categories.items():
+            numpy.save(os.path.join(directory, 'categories.%s.npy' % column),
+                       numpy.array(categories, dtype=str))
+
+        with open(os.path.join(directory, 'store.json'), 'w') as f:
+            json.dump({'columns': list(self.columns),
+                       'categories': list(self.categories),
+                       'modality': any(modality is not None
+                                       for _, modality in keys)}, f)
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        """Load store saved by `save`
+
+        Columns are memory-mapped (unless `mmap_mode` is None), categories
+        and groups are loaded in memory.
+        """
+
+        with open(os.path.join(directory, 'store.json'), 'r') as f:
+            description = json.load(f)
+
+        columns = {
+            column: numpy.load(
+                os.path.join(directory, 'column.%s.npy' % column),
+                mmap_mode=mmap_mode)
+            for column in description['columns']}
+
+        categories = {
+            column: numpy.load(
+                os.path.join(directory, 'categories.%s.npy' % column)
+            ).astype(object)
+            for column in description['categories']}
+
+        uris = numpy.load(os.path.join(directory, 'uris.npy')).tolist()
+        if description['modality']:
+            modalities = numpy.load(
+                os.path.join(directory, 'modalities.npy')).tolist()
+        else:
+            modalities = [None] * len(uris)
+        bounds = numpy.load(os.path.join(directory, 'groups.npy')).tolist()
+        groups = {(uri, modality): tuple(bound) for uri, modality, bound
+                  in zip(uris, modalities, bounds)}
+
+        return cls(columns, groups, categories=categories)
+
+    def __len__(self):
+        return len(self.groups)
+
+    def __iter__(self):
+        return iter(self.groups)
+
+    def __contains__(self, key):
+        return key in self.groups
+
+    def __getitem__(self, key):
+        """Get (decoded) entries of a given (uri, modality) group
+
+        Returns
+        -------
+        columns : dict
+            Column name to numpy.ndarray dictionary.
+        """
+        start, stop = self.groups[key]
+        columns = {}
+        for column, values in self.columns.items():
+            values = values[start:stop]
+            if column in self.categories:
+                values = self.categories[column][values]
+            columns[column] = values
+        return columns
+
+
+class LazyLoaded(Mapping):
+    """(uri, modality) to annotation mapping, built upon first access
+
+    Parameters
+    ----------
+    store : ColumnStore, optional
+    build : callable
+        Called as build(columns, uri=uri, modality=modality).
+
+    Notes
+    -----
+    Several stores (e.g. read from several files) can be added. Entries of
+    a (uri, modality) pair found in more than one store are concatenated,
+    in the order stores were added.
+    """
+
+    def __init__(self, store=None, build=None):
+        super(LazyLoaded, self).__init__()
+        self.build = build
+        self._parts = {}
+        self._built = {}
+        if store is not None:
+            self.add(store)
+
+    def add(self, store):
+        """Add entries of another store
+
+        Annotations already built are updated in place (with their `update`
+        method) rather than built again.
+        """
+        for key in store:
+            self._parts.setdefault(key, []).append(store)
+            if key in self._built:
+                uri, modality = key
+                self._built[key].update(
+                    self.build(store[key], uri=uri, modality=modality))
+
+    def __len__(self):
+        return len(self._parts)
+
+    def __iter__(self):
+        return iter(self._parts)
+
+    def __contains__(self, key):
+        return key in self._parts
+
+    def __getitem__(self, key):
+        try:
+            return self._built[key]
+        except KeyError:
+            pass
+
+        parts = [store[key] for store in self._parts[key]]
+        if len(parts) == 1:
+            columns = parts[0]
+        else:
+            columns = {column: numpy.concatenate([part[column]
+                                                  for part in parts])
+                       for column in parts[0]}
+
+        uri, modality = key
+        built = self.build(columns, uri=uri, modality=modality)
+        self._built[key] = built
+        return built
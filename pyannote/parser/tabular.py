@@ -0,0 +1,1266 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+from abc import abstractmethod
+from pyannote.parser.base import Parser
+from pyannote.parser.base import PYANNOTE_URI, PYANNOTE_MODALITY, \
+    PYANNOTE_TRACK, PYANNOTE_LABEL
+from pyannote.parser.store import ColumnStore, LazyLoaded
+from pyannote.parser.cache import ParseCache
+from pyannote.parser.compression import open_file, infer_compression, \
+    borrow, BUFFERS
+from pyannote.parser.writer import Writer
+
+import io
+import os
+import re
+import math
+import pickle
+import shutil
+import tempfile
+
+import numpy
+
+
+def _load_range(task):
+    """Load entries located in a byte range (run by TabularParser workers)"""
+
+    import pandas
+
+    Parser, path, start, stop, engine = task
+    parser = Parser()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    try:
+        df = parser._load(io.BytesIO(data), engine=engine)
+    except pandas.errors.EmptyDataError:
+        return None
+    # only send back what is needed
+    keep = [PYANNOTE_URI, PYANNOTE_MODALITY] + parser._columns()
+    return df[[column for column in df if column in keep]]
+
+
+class TabularParser(Parser):
+    """Base class for text formats with one whitespace-delimited entry per line
+
+    Subclasses describe the format (`fields`, `comment`, `converters`,
+    `get_start_end`) and how one resource is built from its entries
+    (`_build`).
+
+    Parameters
+    ----------
+    cache : str, optional
+        Path to a directory where parsed files are cached (see `ParseCache`).
+        Defaults to not caching anything.
+    cache_size : int, optional
+        Maximum size of the cache, in bytes. Defaults to 1GB.
+    """
+
+    def __init__(self, cache=None, cache_size=2 ** 30):
+        super(TabularParser, self).__init__()
+        if cache is None:
+            self.cache = None
+        else:
+            self.cache = ParseCache(cache, size=cache_size)
+        # first available track number (see `_renumber`)
+        self._next_track = 0
+        # followed file (see `follow`)
+        self._tail = None
+        self._subscribers = []
+
+    @abstractmethod
+    def fields(self):
+        pass
+
+    @abstractmethod
+    def get_segment(self, row):
+        pass
+
+    def get_start_end(self, df):
+        """Get start and end times of all entries at once
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            One row per entry, one column per field (see `fields`).
+
+        Returns
+        -------
+        start, end : numpy.ndarray
+            Start and end times, in seconds.
+
+        Notes
+        -----
+        Default implementation falls back to (slow) row-wise `get_segment`.
+        Parsers are expected to override it with column-wise arithmetic.
+        """
+        segments = [self.get_segment(row) for row in df.itertuples()]
+        start = numpy.array([segment.start for segment in segments],
+                            dtype=float)
+        end = numpy.array([segment.end for segment in segments], dtype=float)
+        return start, end
+
+    def converters(self):
+        return None
+
+    def comment(self):
+        return None
+
+    def dtype(self):
+        return {PYANNOTE_URI: object}
+
+    def _read_table(self, path, engine='c', chunksize=None, usecols=None):
+        """Tokenize file
+
+        Parameters
+        ----------
+        path : str, file-like, bytes or memoryview
+            Compressed files (e.g. .mdtm.gz) are decompressed on the fly.
+        engine : {'c', 'pyarrow', 'python'}, optional
+            'c' relies on pandas C tokenizer (default), 'pyarrow' on pyarrow
+            CSV reader (when installed) and 'python' is a dependency-free
+            fallback. They all lead to the same data frame.
+        chunksize : int, optional
+            Return an iterator over data frames of (about) `chunksize` lines.
+        usecols : list, optional
+            Only tokenize these columns.
+
+        Returns
+        -------
+        df : pandas.DataFrame or iterator
+            One row per entry, one column per field (see `fields`).
+        """
+
+        if self._is_compressed(path):
+            if chunksize:
+                return self._iter_compressed(path, engine=engine,
+                                             chunksize=chunksize,
+                                             usecols=usecols)
+            with open_file(path, 'rb') as f:
+                return self._read_table(f, engine=engine, usecols=usecols)
+
+        # pyarrow reads buffers in place
+        if isinstance(path, BUFFERS) and engine != 'pyarrow':
+            path = open_file(path, 'rb')
+
+        if engine == 'c':
+            return self._read_table_c(path, chunksize=chunksize,
+                                      usecols=usecols)
+
+        if engine == 'pyarrow':
+            chunks = self._read_table_pyarrow(path, chunksize=chunksize,
+                                              usecols=usecols)
+        elif engine == 'python':
+            chunks = self._read_table_python(path, chunksize=chunksize,
+                                             usecols=usecols)
+        else:
+            raise ValueError('unknown engine "%s"' % engine)
+
+        return chunks if chunksize else next(chunks)
+
+    @staticmethod
+    def _is_compressed(path):
+        return TabularParser._on_disk(path) and \
+            infer_compression(os.fspath(path)) is not None
+
+    @staticmethod
+    def _on_disk(path):
+        """Whether `path` is a path (rather than a stream or a buffer)"""
+        return isinstance(path, (str, os.PathLike))
+
+    def _iter_compressed(self, path, engine='c', chunksize=None,
+                         usecols=None):
+        with open_file(path, 'rb') as f:
+            for df in self._read_table(f, engine=engine, chunksize=chunksize,
+                                       usecols=usecols):
+                yield df
+
+    def _read_table_c(self, path, chunksize=None, usecols=None):
+        import pandas
+
+        # pandas closes the file objects it wraps (e.g. binary streams)
+        if hasattr(path, 'read'):
+            path = borrow(path)
+
+        # passing converters (even None) forces pandas off its fast path
+        kwargs = {}
+        if self.converters() is not None:
+            kwargs['converters'] = self.converters()
+
+        return pandas.read_table(path,
+                                 sep=r'\s+', engine='c',
+                                 header=None, names=self.fields(),
+                                 comment=self.comment(),
+                                 skip_blank_lines=True,
+                                 dtype=self.dtype(),
+                                 keep_default_na=False, na_values=[],
+                                 chunksize=chunksize, usecols=usecols,
+                                 **kwargs)
+
+    def _from_strings(self, df):
+        """Convert columns of strings the same way pandas would"""
+
+        import pandas
+
+        dtype = self.dtype()
+        converters = self.converters() or {}
+
+        for column in df:
+            if column in converters:
+                df[column] = df[column].map(converters[column])
+            elif column not in dtype:
+                try:
+                    df[column] = pandas.to_numeric(df[column])
+                except (ValueError, TypeError):
+                    pass
+
+        return df
+
+    def _read_table_python(self, path, chunksize=None, usecols=None):
+        """Pure-Python tokenizer (yields data frames of `chunksize` lines)"""
+
+        import pandas
+
+        fields = self.fields()
+        n_fields = len(fields)
+        comment = self.comment()
+
+        def to_df(rows):
+            df = pandas.DataFrame(rows, columns=fields, dtype=object)
+            if usecols is not None:
+                df = df[usecols]
+            return self._from_strings(df)
+
+        with open_file(path, 'r', compression=None) as f:
+
+            rows = []
+            for line in f:
+
+                if comment is not None:
+                    line = line.split(comment, 1)[0]
+
+                tokens = line.split()
+                if not tokens:
+                    continue
+
+                rows.append(tokens[:n_fields] +
+                            [None] * (n_fields - len(tokens)))
+
+                if chunksize and len(rows) == chunksize:
+                    yield to_df(rows)
+                    rows = []
+
+            if rows or not chunksize:
+                yield to_df(rows)
+
+    def _read_table_pyarrow(self, path, chunksize=None, usecols=None):
+        """pyarrow-based tokenizer (yields data frames)
+
+        pyarrow CSV reader does not support runs of whitespaces as delimiter
+        nor comments: entries are expected to be delimited by exactly one
+        space, and lines that do not have the expected number of fields are
+        skipped only when they are blank or comment lines.
+        """
+
+        try:
+            import pyarrow
+            import pyarrow.csv
+            import pyarrow.compute
+        except ImportError:
+            raise ImportError('engine="pyarrow" requires pyarrow')
+
+        fields = self.fields()
+        comment = self.comment()
+
+        def invalid_row_handler(row):
+            text = row.text.strip()
+            if not text or (comment is not None and text.startswith(comment)):
+                return 'skip'
+            return 'error'
+
+        # read strings (so that comment lines cannot change the type of
+        # columns) and convert them afterwards the way pandas would
+        column_types = {column: pyarrow.string() for column in fields}
+
+        # first field is needed to detect comment lines
+        columns = None if usecols is None else list(usecols)
+        if columns is not None and fields[0] not in columns:
+            columns.append(fields[0])
+
+        read_options = pyarrow.csv.ReadOptions(
+            column_names=fields,
+            block_size=max(2 ** 20, 64 * chunksize) if chunksize else None)
+        parse_options = pyarrow.csv.ParseOptions(
+            delimiter=' ', invalid_row_handler=invalid_row_handler)
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types=column_types, include_columns=columns,
+            null_values=[], strings_can_be_null=False)
+
+        def to_df(table):
+            # remove comment lines that happen to have the expected
+            # number of fields
+            if comment is not None:
+                comments = pyarrow.compute.starts_with(
+                    table.column(fields[0]), comment)
+                table = table.filter(pyarrow.compute.invert(comments))
+            if usecols is not None:
+                table = table.select(list(usecols))
+            return self._from_strings(table.to_pandas())
+
+        # pyarrow reads binary streams, and buffers without copying them
+        if isinstance(path, BUFFERS):
+            path = pyarrow.BufferReader(pyarrow.py_buffer(path))
+        elif isinstance(path, io.TextIOBase):
+            if not hasattr(path, 'buffer'):
+                raise ValueError('engine="pyarrow" cannot read text buffers')
+            path = path.buffer
+
+        try:
+            if chunksize:
+                for batch in pyarrow.csv.open_csv(
+                        path, read_options=read_options,
+                        parse_options=parse_options,
+                        convert_options=convert_options):
+                    yield to_df(pyarrow.Table.from_batches([batch]))
+            else:
+                yield to_df(pyarrow.csv.read_csv(
+                    path, read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options))
+        except pyarrow.ArrowInvalid as e:
+            msg = ('engine="pyarrow" only supports entries delimited by '
+                   'exactly one space -- use engine="c" (%s)')
+            raise ValueError(msg % e)
+
+    def _prepare(self, df):
+        """Remove comment lines and add 'start' and 'end' columns"""
+
+        # lines starting with a comment are dropped by the tokenizer itself
+        # (they are seen as blank lines). remove any remaining comment line
+        # (i.e. lines for which all fields are either None or NaN)
+        df = df[df.notnull().any(axis=1).values]
+
+        # add 'start' and 'end' columns (in seconds)
+        # segments themselves are only built once split by resource
+        start, end = self.get_start_end(df)
+        return df.assign(start=start, end=end)
+
+    def _load(self, path, engine='c', workers=None):
+        """Load whole file as a data frame with 'start' and 'end' columns
+
+        When `workers` > 1, the file is split into that many byte ranges
+        (aligned on line boundaries) that are tokenized in parallel by as
+        many worker processes. Compressed files are always read by the
+        current process.
+        """
+
+        import pandas
+        from concurrent.futures import ProcessPoolExecutor
+
+        # byte ranges only make sense for uncompressed files
+        if workers is None or workers < 2 or self._is_compressed(path) or \
+                not self._on_disk(path):
+            return self._prepare(self._read_table(path, engine=engine))
+
+        size = os.path.getsize(path)
+        boundaries = [0]
+        with open(path, 'rb') as f:
+            for w in range(1, workers):
+                # move to the beginning of the next line
+                f.seek(max(boundaries[-1], w * size // workers - 1))
+                f.readline()
+                boundaries.append(min(f.tell(), size))
+        boundaries.append(size)
+
+        tasks = [(type(self), path, start, stop, engine)
+                 for start, stop in zip(boundaries[:-1], boundaries[1:])
+                 if stop > start]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            dfs = [df for df in executor.map(_load_range, tasks)
+                   if df is not None]
+
+        if not dfs:
+            return self._prepare(self._read_table(path, engine=engine))
+
+        return pandas.concat(dfs, ignore_index=True)
+
+    @abstractmethod
+    def _complete(self, df, uri=None, modality=None, offset=0):
+        """Add columns that are not provided by the file format
+
+        `offset` (int or numpy.ndarray) is the number of entries preceding
+        `df` in the file, i.e. what should be added to the position of an
+        entry in `df` to get its position in the whole file.
+        """
+        pass
+
+    @abstractmethod
+    def _columns(self):
+        """Columns needed by `_build`"""
+        pass
+
+    @abstractmethod
+    def _build(self, columns, uri=None, modality=None):
+        """Build one resource from its entries
+
+        Parameters
+        ----------
+        columns : dict
+            Column name to numpy.ndarray (one item per entry) dictionary.
+        uri, modality : str, optional
+        """
+        pass
+
+    def _partition(self, df):
+        """Partition (complete) data frame by (uri, modality)
+
+        Yields
+        ------
+        (uri, modality), columns : tuple, dict
+            See `ColumnStore`.
+        """
+        store = ColumnStore.from_df(df, self._columns())
+        for key in store:
+            yield key, store[key]
+
+    @staticmethod
+    def index_path(path):
+        """Path to sidecar index of `path` (see `build_index`)"""
+        return os.fspath(path) + '.idx'
+
+    def build_index(self, path):
+        """Build byte-offset index of `path` and save it next to it
+
+        For each (uri, modality) pair, the index stores the byte range of
+        every run of contiguous entries, along with the position (in the
+        whole file) of the first entry of the run and the number of entries.
+        It is used by `read` to only parse the entries of a given resource.
+
+        Parameters
+        ----------
+        path : str
+
+        Returns
+        -------
+        index : dict
+            (uri, modality) to list of [start, stop, first, count] runs.
+            `modality` is None when file format has no modality field.
+
+        Raises
+        ------
+        ValueError
+            When `path` is compressed.
+        """
+
+        if self._is_compressed(path):
+            raise ValueError('cannot index compressed file "%s"' % path)
+
+        fields = self.fields()
+        u = fields.index(PYANNOTE_URI)
+        m = fields.index(PYANNOTE_MODALITY) \
+            if PYANNOTE_MODALITY in fields else None
+        maxsplit = max(u, -1 if m is None else m) + 1
+
+        comment = self.comment()
+        comment = comment.encode('utf-8') if comment else None
+
+        stat = os.stat(path)
+
+        index = {}
+        key = None
+        offset = 0
+        entries = 0
+
+        with open(path, 'rb') as f:
+            for line in f:
+
+                start, offset = offset, offset + len(line)
+
+                # skip blank and comment lines
+                stripped = line.lstrip()
+                if not stripped or \
+                   (comment is not None and stripped.startswith(comment)):
+                    continue
+
+                tokens = stripped.split(None, maxsplit)
+                previous, key = key, (
+                    tokens[u].decode('utf-8'),
+                    None if m is None else tokens[m].decode('utf-8'))
+
+                # extend current run...
+                if key == previous:
+                    run = index[key][-1]
+                    run[1] = offset
+                    run[3] += 1
+
+                # ... or start a new one
+                else:
+                    index.setdefault(key, []).append(
+                        [start, offset, entries, 1])
+
+                entries += 1
+
+        self._save_index(path, index, stat)
+
+        return index
+
+    def _save_index(self, path, index, stat):
+        """Save index as numpy arrays (one row per run)"""
+
+        keys = list(index)
+        runs = numpy.array(
+            [[k] + run for k, key in enumerate(keys) for run in index[key]],
+            dtype=numpy.int64).reshape((-1, 5))
+
+        with open(self.index_path(path), 'wb') as f:
+            numpy.savez(f,
+                        stat=numpy.array([stat.st_size, stat.st_mtime_ns],
+                                         dtype=numpy.int64),
+                        uris=numpy.array([uri for uri, _ in keys], dtype=str),
+                        modalities=numpy.array(
+                            ['' if modality is None else modality
+                             for _, modality in keys], dtype=str),
+                        runs=runs)
+
+    def _load_index(self, path, uris):
+        """Get runs of `uris` from sidecar index (None if missing or outdated)
+
+        Returns
+        -------
+        runs : list
+            List of [start, stop, first, count] runs (see `build_index`).
+        """
+
+        try:
+            sidecar = numpy.load(self.index_path(path))
+        except (IOError, OSError, ValueError):
+            return None
+
+        with sidecar:
+            stat = os.stat(path)
+            if list(sidecar['stat']) != [stat.st_size, stat.st_mtime_ns]:
+                return None
+            groups = numpy.flatnonzero(
+                numpy.isin(sidecar['uris'], list(uris)))
+            runs = sidecar['runs']
+
+        runs = runs[numpy.isin(runs[:, 0], groups), 1:]
+        return runs.tolist()
+
+    def _load_runs(self, path, runs, engine='c'):
+        """Load entries located in given runs (see `build_index`)
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            See `_load`.
+        offset : numpy.ndarray
+            Position of each entry in the whole file, minus its position in
+            `df` (see `_complete`).
+        """
+
+        runs = sorted(runs)
+
+        chunks = []
+        with open(path, 'rb') as f:
+            for start, stop, _, _ in runs:
+                f.seek(start)
+                chunk = f.read(stop - start)
+                if not chunk.endswith(b'\n'):
+                    chunk += b'\n'
+                chunks.append(chunk)
+
+        df = self._load(io.BytesIO(b''.join(chunks)), engine=engine)
+
+        entries = numpy.concatenate(
+            [[]] + [numpy.arange(first, first + count)
+                    for _, _, first, count in runs]).astype(numpy.int64)
+        if len(entries) != len(df):
+            raise ValueError('index of "%s" is corrupted' % path)
+
+        return df, entries - numpy.arange(len(df))
+
+    def _filter(self, df, uris=None, modalities=None, labels=None,
+                start=None, end=None):
+        """Only keep entries matching all given predicates (see `read`)"""
+
+        mask = numpy.ones(len(df), dtype=bool)
+
+        for column, values in [(PYANNOTE_URI, uris),
+                               (PYANNOTE_MODALITY, modalities),
+                               (PYANNOTE_LABEL, labels)]:
+            if values is None:
+                continue
+            if column in df:
+                mask &= df[column].isin(list(values)).values
+            else:
+                mask &= None in values
+
+        if start is not None:
+            mask &= df['end'].values > start
+        if end is not None:
+            mask &= df['start'].values < end
+
+        return df if mask.all() else df[mask]
+
+    def _filter_store(self, store, uris=None, modalities=None, labels=None,
+                      start=None, end=None):
+        """Same as `_filter` for an already partitioned ColumnStore"""
+
+        if uris is not None or modalities is not None:
+            store = store.subset(
+                [(uri, modality) for uri, modality in store
+                 if (uris is None or uri in uris) and
+                    (modalities is None or modality in modalities)])
+
+        if labels is None and start is None and end is None:
+            return store
+
+        mask = numpy.ones(len(store.columns['start']), dtype=bool)
+        if labels is not None:
+            mask &= store.isin(PYANNOTE_LABEL, labels)
+        if start is not None:
+            mask &= store.columns['end'] > start
+        if end is not None:
+            mask &= store.columns['start'] < end
+
+        return store.take(mask)
+
+    def _filters(self, uri=None, uris=None, modalities=None, labels=None,
+                 start=None, end=None):
+        """Get forced uri and filters (see `_filter`) from `read` parameters
+
+        Returns
+        -------
+        forced_uri : str
+            uri of all entries (None unless the format has no uri field).
+        filters : dict
+        """
+
+        if labels is not None and PYANNOTE_LABEL not in self._columns():
+            raise ValueError('labels= is not supported by this parser')
+
+        # `uri` only changes the parsed content when the format has no uri
+        # field: entries of other resources are only filtered out
+        if uri is not None and PYANNOTE_URI in self.fields():
+            uris = [u for u in ([uri] if uris is None else uris) if u == uri]
+            forced_uri = None
+        else:
+            forced_uri = uri
+
+        filters = dict(uris=None if uris is None else set(uris),
+                       modalities=(None if modalities is None
+                                   else set(modalities)),
+                       labels=None if labels is None else set(labels),
+                       start=start, end=end)
+
+        return forced_uri, filters
+
+    def _read_store(self, path, uri=None, modality=None, engine='c',
+                    workers=None, uris=None, modalities=None, labels=None,
+                    start=None, end=None):
+        """Read file into a ColumnStore (see `read` for parameters)"""
+
+        import pandas
+
+        forced_uri, filters = self._filters(
+            uri=uri, uris=uris, modalities=modalities, labels=labels,
+            start=start, end=end)
+        uris = filters['uris']
+        filtered = any(value is not None for value in filters.values())
+
+        # streams are neither cached nor indexed
+        cache = self.cache if self._on_disk(path) else None
+
+        if cache is not None:
+            key = cache.key(path, self, uri=forced_uri, modality=modality)
+            store = cache.get(key)
+            if store is not None:
+                return self._filter_store(store, **filters)
+
+        if uris is not None and PYANNOTE_URI in self.fields() and \
+                self._on_disk(path):
+            runs = self._load_index(path, uris)
+        else:
+            runs = None
+
+        if runs is not None:
+            df, offset = self._load_runs(path, runs, engine=engine)
+            df = self._complete(df, modality=modality, offset=offset)
+            df = self._filter(df, **filters)
+            return ColumnStore.from_df(df, self._columns())
+
+        if cache is not None:
+            df = self._load(path, engine=engine, workers=workers)
+            df = self._complete(df, uri=forced_uri, modality=modality)
+            store = ColumnStore.from_df(df, self._columns())
+            cache.put(key, store)
+            return self._filter_store(store, **filters)
+
+        if filtered and workers is None:
+            # only keep matching entries of each chunk in memory
+            df = pandas.concat(
+                [self._filter(df, **filters) for df in self._iter_chunks(
+                    path, uri=forced_uri, modality=modality, engine=engine)],
+                ignore_index=True)
+        else:
+            df = self._load(path, engine=engine, workers=workers)
+            df = self._complete(df, uri=forced_uri, modality=modality)
+            df = self._filter(df, **filters)
+
+        return ColumnStore.from_df(df, self._columns())
+
+    def read(self, path, uri=None, modality=None, lazy=False, engine='c',
+             workers=None, uris=None, modalities=None, labels=None,
+             start=None, end=None, append=False, **kwargs):
+        """
+
+        Parameters
+        ----------
+        path : str, file-like, bytes or memoryview
+            Path to file, already opened (binary or text) file, or file
+            contents. Opened files are read from their current position
+            and are left open.
+        uri : str, optional
+            Only load entries of this resource. When file format does not
+            provide any field related to resource, force all entries to be
+            considered as coming from this resource instead.
+            When a valid index is available (see `build_index`), only the
+            corresponding byte ranges are read.
+        modality : str, optional
+            Force all entries to be considered as coming from this modality.
+            Only taken into account when file format does not provide
+            any field related to modality (e.g. .seg files)
+        lazy : bool, optional
+            Only keep compact columns (start, end, track and label codes)
+            and build each annotation the first time it is requested.
+            Defaults to building all annotations at once.
+        engine : {'c', 'pyarrow', 'python'}, optional
+            Tokenizer (see `_read_table`). Defaults to 'c'.
+        workers : int, optional
+            Split file into that many byte ranges and tokenize them in
+            parallel worker processes. Defaults to a single process.
+        uris, modalities, labels : iterable, optional
+            Only load entries of these resources, modalities or labels.
+        start, end : float, optional
+            Only load entries intersecting this time range. Entries are not
+            cropped.
+        append : bool, optional
+            Merge entries into those already loaded (see `extend`) instead
+            of replacing them.
+
+        Notes
+        -----
+        Filters are applied to parsed columns, before any annotation is
+        built. Unless `workers` is set, the file is then parsed chunk by
+        chunk so that only matching entries are kept in memory.
+
+        When the parser was initialized with a `cache` directory, the parsed
+        file is looked up there first (and added to it otherwise).
+
+        """
+
+        store = self._read_store(path, uri=uri, modality=modality,
+                                 engine=engine, workers=workers, uris=uris,
+                                 modalities=modalities, labels=labels,
+                                 start=start, end=end)
+
+        if append and hasattr(self, '_loaded'):
+            self._merge(store)
+            return self
+
+        self._next_track = 0
+        self._tail = None
+        store = self._renumber(store)
+
+        self._loaded = LazyLoaded(store, self._build)
+        if not lazy:
+            self._loaded = dict(self._loaded)
+
+        return self
+
+    def extend(self, path, **kwargs):
+        """Merge entries of another file into those already loaded
+
+        Same as read(path, append=True, **kwargs).
+
+        Notes
+        -----
+        Loaded annotations stay lazy (or not) regardless of `lazy`.
+        Annotations already built are updated in place with the new entries
+        only, so that the cost is proportional to the number of new entries.
+
+        Track numbers generated for new entries (formats with no track
+        field) start after those of entries already loaded, as if files were
+        concatenated: tracks of two files never collide. Track numbers read
+        from file are kept as they are.
+        """
+        return self.read(path, append=True, **kwargs)
+
+    def _renumber(self, store):
+        """Shift generated track numbers after those already used"""
+
+        if (PYANNOTE_TRACK not in self._columns() or
+                PYANNOTE_TRACK in self.fields()):
+            return store
+
+        tracks = store.columns[PYANNOTE_TRACK]
+        if not len(tracks):
+            return store
+
+        if self._next_track:
+            tracks = tracks + self._next_track
+            columns = dict(store.columns)
+            columns[PYANNOTE_TRACK] = tracks
+            store = ColumnStore(columns, store.groups,
+                                categories=store.categories)
+
+        self._next_track = int(tracks.max()) + 1
+        return store
+
+    def _merge(self, store, renumber=True):
+        """Merge entries of `store` into those already loaded"""
+
+        if renumber:
+            store = self._renumber(store)
+
+        if isinstance(self._loaded, LazyLoaded):
+            self._loaded.add(store)
+
+        else:
+            for key in store:
+                uri, modality = key
+                built = self._build(store[key], uri=uri, modality=modality)
+                if key in self._loaded:
+                    self._loaded[key].update(built)
+                else:
+                    self._loaded[key] = built
+
+        self._indexed(store)
+
+    @staticmethod
+    def _as_column(values):
+        """Get `values` as a list (single values are left untouched)"""
+        if isinstance(values, list):
+            return values
+        # numpy.ndarray or pandas.Series
+        if hasattr(values, 'tolist'):
+            return values.tolist()
+        if isinstance(values, tuple):
+            return list(values)
+        return values
+
+    @staticmethod
+    def _write_lines(f, line, columns):
+        """Write one line per row of `columns`
+
+        Parameters
+        ----------
+        f : file handle
+        line : str
+            Format of one line, with one %-placeholder per column.
+        columns : list
+            Lists of values (one per placeholder), all of the same length.
+            Any other value (e.g. a str) is used for all lines.
+        """
+
+        # values shared by all lines are formatted once and for all
+        literals = re.split(r'%[a-z]', line)
+        placeholders = re.findall(r'%[a-z]', line)
+        line, values = literals[0], []
+        for placeholder, column, literal in zip(placeholders, columns,
+                                                literals[1:]):
+            if not isinstance(column, list):
+                line += TabularParser._escape(placeholder % column)
+            else:
+                line += placeholder
+                values.append(column)
+            line += literal
+
+        if values:
+            f.writelines(map(line.__mod__, zip(*values)))
+
+    @staticmethod
+    def _escape(value):
+        """Escape value to be used as is in a %-format"""
+        return str(value).replace('%', '%%')
+
+    def open_writer(self, path, mode='w', compression='infer',
+                    buffer_size=2 ** 22, flush_interval=None):
+        """Open buffered writer of many annotations (or timelines)
+
+        Parameters
+        ----------
+        path : str or file handle
+        mode : {'w', 'a'}, optional
+            Overwrite (default) or append to existing file.
+        compression : {'infer', 'gzip', 'bz2', 'xz', 'zstd', None}, optional
+            Defaults to inferring compression from `path` suffix
+            (e.g. '.mdtm.gz'). Not used when `path` is a file handle.
+        buffer_size, flush_interval :
+            See `Writer`.
+
+        Returns
+        -------
+        writer : Writer
+            Context manager with `write` and `write_columns` methods.
+        """
+
+        if hasattr(path, 'write'):
+            f, close = path, False
+        else:
+            f, close = open_file(path, mode=mode,
+                                 compression=compression), True
+
+        return Writer(self, f, buffer_size=buffer_size,
+                      flush_interval=flush_interval, close=close)
+
+    def follow(self, path, uri=None, modality=None, lazy=False, **filters):
+        """Load a growing file and keep track of how much of it was read
+
+        Entries later appended to the file are loaded by calling `poll`.
+
+        Parameters
+        ----------
+        path : str
+        uri, modality, lazy :
+            See `read`.
+        filters :
+            `uris`, `modalities`, `labels`, `start` and `end` filters.
+            See `read`.
+
+        Notes
+        -----
+        Only complete lines (i.e. ending with a new line) are parsed.
+        Compressed files cannot be followed.
+        """
+
+        if self._is_compressed(path):
+            raise ValueError('cannot follow compressed file "%s"' % path)
+
+        forced_uri, filters = self._filters(uri=uri, **filters)
+
+        self._loaded = LazyLoaded(build=self._build) if lazy else {}
+        self._next_track = 0
+        self._tail = dict(path=path, position=0, entries=0, uri=forced_uri,
+                          modality=modality, filters=filters)
+        self.poll()
+        return self
+
+    def subscribe(self, callback):
+        """Get notified of entries loaded by `poll`
+
+        Parameters
+        ----------
+        callback : callable
+            Called as callback(uri, modality, delta) for each (uri, modality)
+            pair with new entries, `delta` being the annotation (or timeline)
+            made of those new entries only.
+        """
+        self._subscribers.append(callback)
+
+    def poll(self):
+        """Load entries appended to followed file since last call
+
+        Returns
+        -------
+        deltas : Mapping
+            (uri, modality) to annotation (or timeline) mapping, made of new
+            entries only (and built upon first access). Already loaded
+            annotations are updated in place.
+
+        Raises
+        ------
+        ValueError
+            When no file is being followed or when it was truncated.
+        """
+
+        import pandas
+
+        if self._tail is None:
+            raise ValueError('no file is being followed -- use follow()')
+
+        tail = self._tail
+        path = tail['path']
+
+        size = os.path.getsize(path)
+        if size < tail['position']:
+            msg = '"%s" was truncated -- use follow() again'
+            raise ValueError(msg % path)
+        if size == tail['position']:
+            return {}
+
+        with open(path, 'rb') as f:
+            f.seek(tail['position'])
+            data = f.read(size - tail['position'])
+
+        # only parse complete lines
+        data = data[:data.rfind(b'\n') + 1]
+        if not data:
+            return {}
+        tail['position'] += len(data)
+
+        try:
+            df = self._load(io.BytesIO(data))
+        except pandas.errors.EmptyDataError:
+            return {}
+
+        # track numbers are positions in the whole file
+        df = self._complete(df, uri=tail['uri'], modality=tail['modality'],
+                            offset=tail['entries'])
+        tail['entries'] += len(df)
+        self._next_track = max(self._next_track, tail['entries'])
+        df = self._filter(df, **tail['filters'])
+        # e.g. only comments (or filtered out entries) were appended
+        if not len(df):
+            return {}
+
+        store = ColumnStore.from_df(df, self._columns())
+        self._merge(store, renumber=False)
+
+        deltas = LazyLoaded(store, self._build)
+        if self._subscribers:
+            for (uri, modality), delta in deltas.items():
+                for callback in self._subscribers:
+                    callback(uri, modality, delta)
+
+        return deltas
+
+    def _is_grouped(self, path, chunksize=100000, engine='c'):
+        """Check whether all entries of a given resource are contiguous
+
+        Only the 'uri' column is tokenized.
+        """
+
+        if PYANNOTE_URI not in self.fields():
+            return True
+
+        seen = set()
+        previous = None
+        for df in self._read_table(path, engine=engine, chunksize=chunksize,
+                                   usecols=[PYANNOTE_URI]):
+
+            uris = df[PYANNOTE_URI].values
+            if not len(uris):
+                continue
+
+            # resources of each run of contiguous entries
+            runs = uris[numpy.r_[True, uris[1:] != uris[:-1]]]
+            if runs[0] == previous:
+                runs = runs[1:]
+
+            if len(set(runs)) < len(runs) or not seen.isdisjoint(runs):
+                return False
+
+            seen.update(runs)
+            previous = uris[-1]
+
+        return True
+
+    def _iter_chunks(self, path, uri=None, modality=None, chunksize=100000,
+                     engine='c'):
+        """Iterate over (complete) data frames of about `chunksize` lines"""
+        offset = 0
+        for df in self._read_table(path, engine=engine, chunksize=chunksize):
+            df = self._prepare(df)
+            df = self._complete(df, uri=uri, modality=modality, offset=offset)
+            offset += len(df)
+            yield df
+
+    def _iter_grouped(self, chunks):
+        """Partition chunks of a file grouped by resource
+
+        Only entries of the last resource of each chunk are kept in memory
+        until the next chunk tells whether that resource is complete.
+        """
+
+        import pandas
+
+        done = set()
+        pending = None
+
+        for df in chunks:
+
+            if pending is not None:
+                df = pandas.concat([pending, df], ignore_index=True)
+
+            if not len(df):
+                continue
+
+            uris = df[PYANNOTE_URI].values
+            last = uris[-1]
+            is_last = uris == last
+
+            complete, pending = df[~is_last], df[is_last]
+            completed = set(complete[PYANNOTE_URI].unique())
+            if not done.isdisjoint(completed) or last in done:
+                msg = ('entries are not grouped by resource '
+                       '-- use grouped=False')
+                raise ValueError(msg)
+            done.update(completed)
+
+            for key, columns in self._partition(complete):
+                yield key, columns
+
+        if pending is not None:
+            for key, columns in self._partition(pending):
+                yield key, columns
+
+    def _iter_spilled(self, chunks, n_buckets):
+        """Partition chunks of a file not grouped by resource
+
+        Entries are spilled to `n_buckets` temporary files (each resource
+        going to exactly one of them) that are then read back one at a time.
+        """
+
+        import pandas
+
+        directory = tempfile.mkdtemp()
+
+        try:
+
+            paths = [os.path.join(directory, str(b))
+                     for b in range(n_buckets)]
+            files = [open(path, 'wb') for path in paths]
+            try:
+                for df in chunks:
+                    uris = df[PYANNOTE_URI].values.astype(object)
+                    buckets = pandas.util.hash_array(uris) % n_buckets
+                    for b, df_ in df.groupby(buckets):
+                        pickle.dump(df_, files[b],
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+            finally:
+                for f in files:
+                    f.close()
+
+            for path in paths:
+
+                parts = []
+                with open(path, 'rb') as f:
+                    while True:
+                        try:
+                            parts.append(pickle.load(f))
+                        except EOFError:
+                            break
+
+                if not parts:
+                    continue
+
+                df = pandas.concat(parts, ignore_index=True)
+                del parts
+
+                for key, columns in self._partition(df):
+                    yield key, columns
+
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def iter_read(self, path, uri=None, modality=None, grouped=None,
+                  chunksize=100000, spill_size=2 ** 26, engine='c',
+                  uris=None, modalities=None, labels=None, start=None,
+                  end=None, **kwargs):
+        """Iterate over resources as soon as they are completely read
+
+        Parameters
+        ----------
+        path : str, file-like, bytes or memoryview
+            See `read`.
+        uri, modality : str, optional
+            See `read`.
+        grouped : bool, optional
+            Whether all entries of a given resource are contiguous in the file.
+            When True, memory usage is bounded by the size of the largest
+            resource (and ValueError is raised if this is not the case).
+            When False, entries are first spilled to temporary files (one per
+            bucket of resources) that are then read back one at a time.
+            Defaults to checking it with a (fast) preliminary pass over the
+            'uri' column. This preliminary pass is not possible for streams
+            that cannot seek: `grouped` must then be provided.
+        chunksize : int, optional
+            Number of lines tokenized at once. Defaults to 100000.
+        spill_size : int, optional
+            Approximate size (in bytes of the original file) of each temporary
+            bucket when `grouped` is False. Defaults to 64MB. Streams that
+            cannot seek (hence whose size is unknown) use 64 buckets.
+        engine : {'c', 'pyarrow', 'python'}, optional
+            Tokenizer (see `_read_table`). Defaults to 'c'.
+        uris, modalities, labels, start, end : optional
+            See `read`. Filters are applied to each chunk, so that only
+            matching entries are kept in memory.
+
+        Yields
+        ------
+        uri, modality, annotation
+            `modality` is None for timelines.
+            When `grouped` is False, resources are yielded in arbitrary order.
+        """
+
+        stream = hasattr(path, 'read')
+        if stream and not path.seekable():
+            position = None
+        elif stream:
+            position = path.tell()
+
+        if grouped is None:
+            if stream and position is None:
+                msg = ('cannot check whether entries of a stream are grouped '
+                       'by resource -- use grouped=True or grouped=False')
+                raise ValueError(msg)
+            grouped = self._is_grouped(path, chunksize=chunksize,
+                                       engine=engine)
+            if stream:
+                path.seek(position)
+
+        forced_uri, filters = self._filters(
+            uri=uri, uris=uris, modalities=modalities, labels=labels,
+            start=start, end=end)
+
+        chunks = (self._filter(df, **filters) for df in self._iter_chunks(
+            path, uri=forced_uri, modality=modality, chunksize=chunksize,
+            engine=engine))
+
+        if grouped:
+            groups = self._iter_grouped(chunks)
+        else:
+            if isinstance(path, BUFFERS):
+                size = memoryview(path).nbytes
+            elif not stream:
+                size = os.path.getsize(path)
+            elif position is not None:
+                size = path.seek(0, io.SEEK_END) - position
+                path.seek(position)
+            else:
+                size = 64 * spill_size
+            n_buckets = int(math.ceil(size / spill_size))
+            groups = self._iter_spilled(chunks, max(1, n_buckets))
+
+        for (uri, modality), columns in groups:
+            yield uri, modality, self._build(columns, uri=uri,
+                                             modality=modality)
@@ -26,51 +26,14 @@
 # AUTHORS
 # Hervé BREDIN - http://herve.niderb.fr
 
-from abc import abstractmethod
-from pyannote.parser.base import Parser
+from pyannote.parser.tabular import TabularParser
 
-from pyannote.core import Timeline
-from pyannote.core import PYANNOTE_URI, PYANNOTE_SEGMENT
+from pyannote.parser.base import PYANNOTE_URI
 
-import pandas
 
+class TimelineParser(TabularParser):
 
-class TimelineParser(Parser):
-
-    @abstractmethod
-    def fields(self):
-        pass
-
-    @abstractmethod
-    def get_segment(self, row):
-        pass
-
-    def converters(self):
-        return None
-
-    def comment(self):
-        return None
-
-    def read(self, path, uri=None, **kwargs):
-
-        # load whole file
-        df = pandas.read_table(path,
-                               delim_whitespace=True,
-                               header=None, names=self.fields(),
-                               comment=self.comment(),
-                               converters=self.converters(),
-                               keep_default_na=False, na_values=[],
-                               dtype={PYANNOTE_URI: object})
-
-        # remove comment lines
-        # (i.e. lines for which all fields are either None or NaN)
-        keep = [not all(pandas.isnull(item) for item in row[1:])
-                for row in df.itertuples()]
-        df = df[keep]
-
-        # add 'segment' column build from start time & duration
-        df[PYANNOTE_SEGMENT] = [self.get_segment(row)
-                                for row in df.itertuples()]
+    def _complete(self, df, uri=None, **kwargs):
 
         # add uri column in case it does not exist
         if PYANNOTE_URI not in df:
@@ -78,23 +41,20 @@ class TimelineParser(Parser):
                 raise ValueError('missing uri -- use uri=')
             df[PYANNOTE_URI] = uri
 
-        # obtain list of resources
-        uris = list(df[PYANNOTE_URI].unique())
-
-        self._loaded = {}
-
-        # loop on resources
-        for uri in uris:
+        return df
 
-            # filter based on resource
-            df_ = df[df[PYANNOTE_URI] == uri]
+    def _columns(self):
+        return ['start', 'end']
 
-            t = Timeline.from_df(df_, uri=uri)
-            self._loaded[uri, None] = t
-
-        return self
+    def _build(self, columns, uri=None, **kwargs):
+        """Build timeline from 'start' and 'end' columns"""
+        from pyannote.core import Timeline, Segment
+        segments = [Segment(start, end) for start, end
+                    in zip(columns['start'].tolist(), columns['end'].tolist())]
+        return Timeline(segments=segments, uri=uri)
 
     def empty(self, uri=None, **kwargs):
+        from pyannote.core import Timeline
         return Timeline(uri=uri)
 
     def write(self, timeline, f, uri=None, **kwargs):
@@ -116,5 +76,35 @@ class TimelineParser(Parser):
 
         self._append(timeline, f, uri)
 
+    def write_columns(self, columns, f, uri=None, **kwargs):
+        """Write segments given column-wise
+
+        Parameters
+        ----------
+        columns : dict or pandas.DataFrame
+            'start' and 'end' columns, and optional 'uri' column.
+        f : file handle
+        uri : str, optional
+            Used when `columns` has no 'uri' column.
+        """
+
+        columns = {name: columns.get(name, default) for name, default in [
+            (PYANNOTE_URI, uri), ('start', None), ('end', None)]}
+
+        self._write_columns(f, {name: self._as_column(values)
+                                for name, values in columns.items()})
+
     def _append(self, timeline, f, uri):
         raise NotImplementedError('')
+
+    def _write_columns(self, f, columns):
+        """Write segments
+
+        Parameters
+        ----------
+        f : file handle
+        columns : dict
+            'uri', 'start' and 'end' lists (or single values shared by all
+            segments).
+        """
+        raise NotImplementedError('')
@@ -28,8 +28,7 @@
 
 from __future__ import unicode_literals
 
-from pyannote.core import Segment
-from pyannote.core import PYANNOTE_URI
+from pyannote.parser.base import PYANNOTE_URI
 
 from .base import TimelineParser
 
@@ -55,10 +54,17 @@ class UEMParser(TimelineParser):
         return ';'
 
     def get_segment(self, row):
+        from pyannote.core import Segment
         return Segment(row[3], row[4])
 
-    def _append(self, timeline, f, uri):
+    def get_start_end(self, df):
+        return df['start'].values, df['end'].values
 
-        format = '%s 1 %%g %%g\n' % (uri)
+    def _append(self, timeline, f, uri):
+        format = '%s 1 %%g %%g\n' % self._escape(uri)
         for segment in timeline:
             f.write(format % (segment.start, segment.end))
+
+    def _write_columns(self, f, columns):
+        self._write_lines(f, '%s 1 %g %g\n', [
+            columns[PYANNOTE_URI], columns['start'], columns['end']])
@@ -41,12 +41,6 @@ http://transag.sourceforge.net/
 
 import re
 
-try:
-    from lxml import objectify
-except:
-    pass
-
-from pyannote.core import Segment
 from base import BaseAnnotationParser
 
 
@@ -89,6 +83,9 @@ class TRSParser(BaseAnnotationParser):
 
     def read(self, path, uri=None, **kwargs):
 
+        from lxml import objectify
+        from pyannote.core import Segment
+
         # objectify xml file and get root
         root = objectify.parse(path).getroot()
 
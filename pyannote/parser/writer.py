@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+"""Buffered writer of many annotations (or timelines) to one file"""
+
+import io
+import time
+
+
+class Writer(object):
+    """Buffered writer of many annotations (or timelines) to one file
+
+    Use `TabularParser.open_writer` to create one.
+
+    Parameters
+    ----------
+    parser : TabularParser
+        Parser providing `write` and `write_columns` methods.
+    f : file handle
+    buffer_size : int, optional
+        Write buffer to `f` once it holds that many characters.
+        Defaults to 4M.
+    flush_interval : float, optional
+        Also write buffer to `f` (and flush `f`) once that many seconds have
+        passed since last flush. Only checked upon writing.
+        Defaults to only flushing based on `buffer_size`.
+    close : bool, optional
+        Close `f` when the writer is closed. Defaults to True.
+
+    Usage
+    -----
+    >>> with MDTMParser().open_writer('/path/to/file.mdtm.gz') as writer:
+    ...     for annotation in annotations:
+    ...         writer.write(annotation)
+    """
+
+    def __init__(self, parser, f, buffer_size=2 ** 22, flush_interval=None,
+                 close=True):
+        super(Writer, self).__init__()
+        self.parser = parser
+        self.f = f
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._close = close
+        self._buffer = io.StringIO()
+        self._flushed = time.time()
+
+    def write(self, obj, **kwargs):
+        """Write annotation (or timeline) -- see `parser.write`"""
+        self.parser.write(obj, self._buffer, **kwargs)
+        self._maybe_flush()
+
+    def write_columns(self, columns, **kwargs):
+        """Write entries given column-wise -- see `parser.write_columns`"""
+        self.parser.write_columns(columns, self._buffer, **kwargs)
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if self._buffer.tell() >= self.buffer_size:
+            self._drain()
+        if self.flush_interval is not None and \
+                time.time() - self._flushed >= self.flush_interval:
+            self.flush()
+
+    def _drain(self):
+        """Write buffer to file"""
+        self.f.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def flush(self):
+        """Write buffer to file, and flush file"""
+        self._drain()
+        self.f.flush()
+        self._flushed = time.time()
+
+    def close(self):
+        if self.f is None:
+            return
+        self._drain()
+        if self._close:
+            self.f.close()
+        else:
+            self.f.flush()
+        self.f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
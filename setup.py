@@ -39,9 +39,12 @@ setup(
     # package
     namespace_packages=['pyannote'],
     packages=find_packages(),
+    # module-level __getattr__ (PEP 562) requires Python 3.7
+    python_requires='>=3.7',
     install_requires=[
         'pyannote.core >= 3.3',
-        'six >= 1.10.0'
+        'six >= 1.10.0',
+        'importlib_metadata; python_version < "3.8"',
     ],
     # versioneer
     version=versioneer.get_version(),
@@ -58,7 +61,6 @@ setup(
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Topic :: Scientific/Engineering"
@@ -72,5 +74,14 @@ setup(
         SEGParser=pyannote.parser.annotation.seg:SEGParser
         REPEREParser=pyannote.parser.annotation.repere:REPEREParser
         UEMParser=pyannote.parser.timeline.uem:UEMParser
+        [pyannote.parser.extension]
+        lst=pyannote.parser.generic.lst:LSTParser
+        json=pyannote.parser.generic.json:JSONParser
+        pkl=pyannote.parser.generic.pkl:PKLParser
+        mdtm=pyannote.parser.annotation.mdtm:MDTMParser
+        seg=pyannote.parser.annotation.seg:SEGParser
+        repere=pyannote.parser.annotation.repere:REPEREParser
+        hyp=pyannote.parser.annotation.repere:REPEREParser
+        uem=pyannote.parser.timeline.uem:UEMParser
     """
 )
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+from __future__ import print_function
+
+import pytest
+from pyannote.parser import MDTMParser
+import tempfile
+import shutil
+import os
+
+SAMPLE = """uri1 channel 1.0 2.5 speech 0.9 female alice
+uri2 channel 3.0 4.5 speaker 0.7 female barbara
+uri1 channel 6.0 3.0 speaker 0.8 male chris
+"""
+
+
+@pytest.fixture
+def sample(request):
+
+    _, filename = tempfile.mkstemp()
+    with open(filename, 'w') as f:
+        f.write(SAMPLE)
+
+    def delete():
+        os.remove(filename)
+    request.addfinalizer(delete)
+
+    return filename
+
+
+@pytest.fixture
+def cache(request):
+
+    directory = tempfile.mkdtemp()
+
+    def delete():
+        shutil.rmtree(directory)
+    request.addfinalizer(delete)
+
+    return directory
+
+
+def test_cache(sample, cache):
+    parser = MDTMParser().read(sample)
+    cold = MDTMParser(cache=cache).read(sample)
+    assert len(os.listdir(cache)) == 1
+    warm = MDTMParser(cache=cache).read(sample)
+    for p in [cold, warm]:
+        assert p.uris == parser.uris
+        for uri in parser.uris:
+            for modality in parser.modalities:
+                assert p(uri=uri, modality=modality) == \
+                    parser(uri=uri, modality=modality)
+    uri2 = MDTMParser(cache=cache).read(sample, uri='uri2')
+    assert uri2.uris == ('uri2', )
+    chris = MDTMParser(cache=cache).read(sample, labels=['chris'], end=7)
+    assert chris.uris == ('uri1', )
+
+
+def test_cache_eviction(sample, cache):
+    MDTMParser(cache=cache, cache_size=0).read(sample)
+    assert not os.listdir(cache)
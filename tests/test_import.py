@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+from __future__ import print_function
+
+import sys
+import subprocess
+
+import pyannote.core
+import pyannote.parser.base
+
+HEAVY = ['pandas', 'pyannote.core', 'lxml']
+
+SCRIPT = """
+import sys
+import pyannote.parser
+from pyannote.parser import MagicParser, LSTParser, PKLParser, MDTMParser
+print(' '.join(module for module in %r if module in sys.modules))
+""" % (HEAVY, )
+
+
+def test_lazy_imports():
+    imported = subprocess.check_output([sys.executable, '-c', SCRIPT])
+    assert imported.decode().split() == []
+
+
+def test_constants():
+    for name in ['PYANNOTE_URI', 'PYANNOTE_MODALITY',
+                 'PYANNOTE_TRACK', 'PYANNOTE_LABEL']:
+        assert getattr(pyannote.parser.base, name) == \
+            getattr(pyannote.core, name)
@@ -31,6 +31,7 @@ from __future__ import print_function
 import pytest
 from pyannote.parser import LSTParser
 import tempfile
+import io
 import os
 
 SAMPLE = """item1
@@ -56,3 +57,20 @@ def sample(request):
 def test_load(sample):
     parser = LSTParser()
     assert parser.read(sample) == ["item1", "item2", "item3"]
+
+
+def test_load_buffers():
+    for source in [SAMPLE.encode('utf-8'), memoryview(SAMPLE.encode('utf-8')),
+                   io.BytesIO(SAMPLE.encode('utf-8')), io.StringIO(SAMPLE)]:
+        assert LSTParser().read(source) == ["item1", "item2", "item3"]
+
+
+@pytest.mark.parametrize('index', [False, True])
+def test_mmap(sample, index):
+    lines = LSTParser().read(sample, mmap=True, index=index)
+    assert len(lines) == 3
+    assert list(lines) == ["item1", "item2", "item3"]
+    assert lines[1] == "item2" and lines[-1] == "item3"
+    assert lines[::2] == ["item1", "item3"]
+    assert "item2" in lines
+    assert "item" not in lines
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2026 CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+from __future__ import print_function
+
+import pytest
+from pyannote.core import Segment
+import pyannote.parser
+from pyannote.parser import MagicParser, MDTMParser, ParserPlugins
+from pyannote.parser.memory import MemoryCache
+from pyannote.parser.sniff import sniff_format
+import tempfile
+import shutil
+import gzip
+import io
+import os
+
+SAMPLES = [
+    ('uri1.mdtm', 'uri1 channel 1.0 2.5 speech 0.9 female alice\n'),
+    ('uri2.mdtm', 'uri2 channel 3.0 4.5 speech 0.7 female barbara\n'),
+    ('shared.mdtm', 'uri1 channel 6.0 3.0 speech 0.8 male chris\n'),
+    ('unknown.xyz', 'whatever\n'),
+]
+
+
+@pytest.fixture
+def samples(request):
+
+    directory = tempfile.mkdtemp()
+    for name, content in SAMPLES:
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(content)
+
+    def delete():
+        shutil.rmtree(directory)
+    request.addfinalizer(delete)
+
+    return [os.path.join(directory, name) for name, _ in SAMPLES]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_read_many(samples, workers):
+    parser, failures = MagicParser().read_many(samples, workers=workers)
+    assert isinstance(parser, MDTMParser)
+    assert list(failures) == [samples[-1]]
+    assert parser.uris == ('uri1', 'uri2')
+    assert list(parser(uri='uri1', modality='speech').itertracks(
+        yield_label=True)) == [(Segment(1, 3.5), 0, 'alice'),
+                               (Segment(6, 9), 2, 'chris')]
+
+
+def test_read_many_failures(samples):
+    directory = os.path.dirname(samples[0])
+    uem = os.path.join(directory, 'uri1.uem')
+    with open(uem, 'w') as f:
+        f.write('uri1 1 0.0 10.0\n')
+
+    # files with another format are reported, duplicates are read once
+    paths = samples + [uem, samples[0], os.path.join(directory, '.',
+                                                      'uri1.mdtm')]
+    parser, failures = MagicParser().read_many(paths, workers=1)
+    assert isinstance(parser, MDTMParser)
+    assert sorted(failures) == sorted([samples[-1], uem])
+    assert len(parser(uri='uri1', modality='speech')) == 2
+
+    # unsupported options are rejected once
+    with pytest.raises(TypeError):
+        MagicParser().read_many(samples, workers=1, append=True)
+
+
+@pytest.mark.parametrize('suffix', ['', '.gz', '.bz2', '.xz', '.zst'])
+def test_compression(samples, suffix):
+    if suffix == '.zst':
+        pytest.importorskip('zstandard')
+    parser = MDTMParser().read(samples[0])
+    annotation = parser(uri='uri1', modality='speech')
+    path = samples[0] + suffix
+    with parser.open_writer(path) as writer:
+        writer.write(annotation)
+    magic = MagicParser().read(path)
+    assert isinstance(magic, MDTMParser)
+    assert magic(uri='uri1', modality='speech') == annotation
+
+
+def test_plugins():
+    # extensions declared in entry point metadata match parser classes
+    for extension, Parser in ParserPlugins.items():
+        assert extension in Parser.file_extensions()
+    for name in ParserPlugins.names:
+        Parser = getattr(pyannote.parser, name)
+        for extension in Parser.file_extensions():
+            assert ParserPlugins[extension] is Parser
+
+
+def test_plugins_duplicate(monkeypatch):
+    from importlib.metadata import EntryPoint
+    from pyannote.parser import plugins
+
+    # register UEMParser for .mdtm files as well
+    entry_points = plugins.entry_points
+
+    def duplicate(group):
+        eps = entry_points(group)
+        if group == plugins.EXTENSION_GROUP:
+            eps.append(EntryPoint(
+                'mdtm', 'pyannote.parser.timeline.uem:UEMParser', group))
+        return eps
+
+    monkeypatch.setattr(plugins, 'entry_points', duplicate)
+    monkeypatch.setattr(pyannote.parser, 'ParserPlugins',
+                        plugins.ParserPlugins())
+    for extension in ['uem', 'mdtm']:
+        with pytest.raises(ValueError):
+            MagicParser.get_parser(extension)
+
+
+def test_memory(samples):
+    # no cache by default
+    assert MagicParser().read(samples[0]) is not \
+        MagicParser().read(samples[0])
+
+    memory = MemoryCache(entries=2)
+    magic = MagicParser(memory=memory)
+    parser = magic.read(samples[0])
+    assert magic.read(samples[0]) is parser
+    assert (memory.hits, memory.misses) == (1, 1)
+
+    # modified file is read again
+    with open(samples[0], 'a') as f:
+        f.write('uri1 channel 9.0 1.0 speech 0.9 female alice\n')
+    assert magic.read(samples[0]) is not parser
+
+    # least recently used entries are evicted
+    magic.read(samples[1])
+    magic.read(samples[2])
+    assert len(memory) == 2
+
+    memory.invalidate(samples[2])
+    assert len(memory) == 1
+    memory.invalidate()
+    assert len(memory) == 0
+
+
+@pytest.mark.parametrize('extension, content', [
+    ('mdtm', '; comment\nuri1 1 1.0 2.5 speech 0.9 female alice\n'),
+    ('repere', 'uri1 1.0 3.5 speaker alice\n'),
+    ('seg', 'uri1 alice 1 100 250\n'),
+    ('uem', 'uri1 1 0.0 10.0\n'),
+    ('json', '{"pyannote": "Annotation", "content": []}'),
+    ('trs', '<?xml version="1.0"?>\n<Trans>\n'),
+    ('lst', 'uri1\nuri2\n'),
+    (None, 'uri1 1 0.0 10.0\nuri1 1.0 3.5 speaker alice\n'),
+    # prose, code and binary contents are not mistaken for lists
+    (None, 'pyannote.parser\n===============\n\nSome text.\n'),
+    (None, 'import os\nfrom setuptools import setup\n'),
+    (None, '\xe9t\xe9\n'.encode('latin-1')),
+    (None, b'\x00\x01\x02\n'),
+])
+def test_sniff_format(extension, content):
+    if not isinstance(content, bytes):
+        content = content.encode('utf-8')
+    assert sniff_format(content) == extension
+
+
+def test_sniff(samples):
+    with open(samples[0], 'rb') as f:
+        content = f.read()
+    expected = MagicParser().read(samples[0])(uri='uri1', modality='speech')
+
+    # stream, compressed stream and extension-less file
+    path = os.path.join(os.path.dirname(samples[0]), 'noextension')
+    with open(path, 'wb') as f:
+        f.write(content)
+    for source in [io.BytesIO(content), io.BytesIO(gzip.compress(content)),
+                   path]:
+        parser = MagicParser().read(source, sniff=True)
+        assert isinstance(parser, MDTMParser)
+        assert parser(uri='uri1', modality='speech') == expected
+
+    # files are only sniffed on demand
+    with pytest.raises(NotImplementedError):
+        MagicParser().read(path)
+
+    # unknown file format
+    with pytest.raises(NotImplementedError):
+        MagicParser().read(io.BytesIO(b'Some text.\n'))
@@ -29,16 +29,26 @@
 from __future__ import print_function
 
 import pytest
-from pyannote.core import Segment
-from pyannote.parser import MDTMParser
+from pyannote.core import Annotation, Segment
+from pyannote.parser import MDTMParser, REPEREParser, UEMParser
 import tempfile
+import shutil
+import gzip
+import io
 import os
+import pathlib
 
 SAMPLE = """uri1 channel 1.0 2.5 speech 0.9 female alice
 uri1 channel 3.0 4.5 speech 0.7 female barbara
 uri1 channel 6.0 3.0 speech 0.8 male chris
 """
 
+SAMPLE_INTERLEAVED = """uri1 channel 1.0 2.5 speech 0.9 female alice
+uri2 channel 3.0 4.5 speaker 0.7 female barbara
+uri1 channel 6.0 3.0 speaker 0.8 male chris
+uri2 channel 8.0 1.0 speaker 0.8 male chris
+"""
+
 
 @pytest.fixture
 def sample(request):
@@ -54,6 +64,20 @@ def sample(request):
     return filename
 
 
+@pytest.fixture
+def sample_interleaved(request):
+
+    _, filename = tempfile.mkstemp()
+    with open(filename, 'w') as f:
+        f.write(SAMPLE_INTERLEAVED)
+
+    def delete():
+        os.remove(filename)
+    request.addfinalizer(delete)
+
+    return filename
+
+
 def test_load(sample):
     parser = MDTMParser()
     annotations = parser.read(sample)
@@ -62,3 +86,338 @@ def test_load(sample):
         (Segment(1, 3.5), 0, 'alice'),
         (Segment(3, 7.5), 1, 'barbara'),
         (Segment(6, 9), 2, 'chris') ]
+
+
+def test_load_interleaved(sample_interleaved):
+    parser = MDTMParser().read(sample_interleaved)
+    assert parser.uris == ('uri1', 'uri2')
+    assert parser.modalities == ('speaker', 'speech')
+    assert list(parser(uri='uri2').itertracks(yield_label=True)) == [
+        (Segment(3, 7.5), 1, 'barbara'),
+        (Segment(8, 9), 3, 'chris')]
+    assert not parser(uri='uri2', modality='speech')
+
+
+def test_iter_read(sample, sample_interleaved):
+    for path, n_annotations in [(sample, 1), (sample_interleaved, 3)]:
+        parser = MDTMParser().read(path)
+        loaded = list(MDTMParser().iter_read(path, chunksize=1))
+        assert len(loaded) == n_annotations
+        for uri, modality, annotation in loaded:
+            assert annotation == parser(uri=uri, modality=modality)
+
+
+class _Pipe(io.RawIOBase):
+    """Binary stream that cannot seek (e.g. standard input)"""
+
+    def __init__(self, content):
+        super(_Pipe, self).__init__()
+        self._f = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._f.readinto(b)
+
+
+def test_iter_read_buffers(sample, sample_interleaved):
+    for path, n_annotations in [(sample, 1), (sample_interleaved, 3)]:
+        parser = MDTMParser().read(path)
+        with open(path, 'rb') as f:
+            content = f.read()
+        sources = [(content, None), (memoryview(content), False),
+                   (io.BytesIO(content), None), (io.BytesIO(content), False),
+                   (io.StringIO(content.decode('utf-8')), None),
+                   (io.BufferedReader(_Pipe(content)), False)]
+        for source, grouped in sources:
+            loaded = list(MDTMParser().iter_read(source, grouped=grouped,
+                                                 chunksize=1))
+            assert len(loaded) == n_annotations
+            for uri, modality, annotation in loaded:
+                assert annotation == parser(uri=uri, modality=modality)
+
+    # streams that cannot seek cannot be checked for grouping
+    with pytest.raises(ValueError):
+        list(MDTMParser().iter_read(io.BufferedReader(_Pipe(content))))
+
+
+def test_iter_read_filters(sample_interleaved):
+    for kwargs in [dict(uri='uri2'), dict(uris=['uri1']),
+                   dict(modalities=['speaker'], labels=['chris']),
+                   dict(start=3.5, end=7)]:
+        parser = MDTMParser().read(sample_interleaved, **kwargs)
+        for grouped in [None, False]:
+            loaded = list(MDTMParser().iter_read(
+                sample_interleaved, grouped=grouped, chunksize=1, **kwargs))
+            assert sorted((uri, modality) for uri, modality, _ in loaded) == \
+                [(uri, modality) for uri in parser.uris
+                 for modality in parser.modalities
+                 if parser(uri=uri, modality=modality)]
+            for uri, modality, annotation in loaded:
+                assert annotation == parser(uri=uri, modality=modality)
+
+
+def test_iter_read_not_grouped(sample_interleaved):
+    with pytest.raises(ValueError):
+        list(MDTMParser().iter_read(sample_interleaved, grouped=True,
+                                    chunksize=1))
+
+
+def test_load_lazy(sample_interleaved):
+    parser = MDTMParser().read(sample_interleaved)
+    lazy = MDTMParser().read(sample_interleaved, lazy=True)
+    assert lazy.uris == parser.uris
+    assert lazy.modalities == parser.modalities
+    for uri in parser.uris:
+        for modality in parser.modalities:
+            assert lazy(uri=uri, modality=modality) == \
+                parser(uri=uri, modality=modality)
+    assert lazy(uri='uri1', modality='speech') is \
+        lazy(uri='uri1', modality='speech')
+
+
+def test_read_uri_with_index(sample_interleaved):
+    parser = MDTMParser()
+    parser.build_index(sample_interleaved)
+    assert os.path.exists(parser.index_path(sample_interleaved))
+    uri2 = parser.read(sample_interleaved, uri='uri2')
+    assert uri2.uris == ('uri2', )
+    assert list(uri2(uri='uri2').itertracks(yield_label=True)) == [
+        (Segment(3, 7.5), 1, 'barbara'),
+        (Segment(8, 9), 3, 'chris')]
+    os.remove(parser.index_path(sample_interleaved))
+
+
+def test_read_uri_pathlib(sample_interleaved):
+    path = pathlib.Path(sample_interleaved)
+    for index in [False, True]:
+        if index:
+            MDTMParser().build_index(path)
+        uri2 = MDTMParser().read(path, uri='uri2')
+        assert uri2.uris == ('uri2', )
+        assert len(uri2(uri='uri2', modality='speaker')) == 2
+    os.remove(MDTMParser.index_path(path))
+
+
+@pytest.mark.parametrize('engine', ['pyarrow', 'python'])
+def test_engine(sample_interleaved, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    parser = MDTMParser().read(sample_interleaved)
+    other = MDTMParser().read(sample_interleaved, engine=engine)
+    assert other.uris == parser.uris
+    for uri in parser.uris:
+        for modality in parser.modalities:
+            assert list(other(uri=uri, modality=modality).itertracks(
+                yield_label=True)) == list(parser(
+                    uri=uri, modality=modality).itertracks(yield_label=True))
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow', 'python'])
+def test_engine_comment(engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    # comment line with as many fields as an entry
+    content = (';; uri channel start duration modality conf gender label\n'
+               'uri1 1 1.0 2.5 speech 0.9 female alice\n')
+    parser = MDTMParser().read(content.encode('utf-8'), engine=engine)
+    assert parser.uris == ('uri1', )
+    assert list(parser(uri='uri1', modality='speech').itertracks(
+        yield_label=True)) == [(Segment(1, 3.5), 0, 'alice')]
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow', 'python'])
+def test_read_buffers(sample_interleaved, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    parser = MDTMParser().read(sample_interleaved)
+    with open(sample_interleaved, 'rb') as f:
+        content = f.read()
+    handle = io.BytesIO(content)
+    for source in [content, memoryview(content), handle,
+                   io.StringIO(content.decode('utf-8'))]:
+        if engine == 'pyarrow' and isinstance(source, io.StringIO):
+            continue
+        other = MDTMParser().read(source, engine=engine)
+        assert other.uris == parser.uris
+        for uri in parser.uris:
+            for modality in parser.modalities:
+                assert other(uri=uri, modality=modality) == \
+                    parser(uri=uri, modality=modality)
+    # opened files are left open
+    assert not handle.closed
+
+
+@pytest.mark.parametrize('workers', [2, 5])
+def test_workers(sample_interleaved, workers):
+    parser = MDTMParser().read(sample_interleaved)
+    other = MDTMParser().read(sample_interleaved, workers=workers)
+    assert other.uris == parser.uris
+    for uri in parser.uris:
+        for modality in parser.modalities:
+            assert list(other(uri=uri, modality=modality).itertracks(
+                yield_label=True)) == list(parser(
+                    uri=uri, modality=modality).itertracks(yield_label=True))
+
+
+@pytest.mark.parametrize('engine', ['c', 'python'])
+def test_read_compressed_pathlib(sample_interleaved, engine):
+    directory = tempfile.mkdtemp()
+    path = pathlib.Path(directory) / 'sample.mdtm.gz'
+    with open(sample_interleaved, 'rb') as f, gzip.open(path, 'wb') as g:
+        g.write(f.read())
+    parser = MDTMParser().read(sample_interleaved)
+    for workers in [None, 2]:
+        other = MDTMParser().read(path, engine=engine, workers=workers)
+        assert other.uris == parser.uris
+    with pytest.raises(ValueError):
+        MDTMParser().follow(path)
+    shutil.rmtree(directory)
+
+
+def test_read_filters(sample_interleaved):
+    parser = MDTMParser().read(sample_interleaved, uris=['uri2'])
+    assert parser.uris == ('uri2', )
+
+    parser = MDTMParser().read(sample_interleaved, modalities=['speaker'],
+                               labels=['chris'])
+    assert parser.uris == ('uri1', 'uri2')
+    annotation = parser(uri='uri2', modality='speaker')
+    assert list(annotation.itertracks(yield_label=True)) == [
+        (Segment(8, 9), 3, 'chris')]
+
+    parser = MDTMParser().read(sample_interleaved, start=3.5, end=7)
+    annotation = parser(uri='uri1', modality='speaker')
+    assert list(annotation.itertracks(yield_label=True)) == [
+        (Segment(6, 9), 2, 'chris')]
+    assert parser.modalities == ('speaker', )
+
+
+def test_call(sample, sample_interleaved):
+    parser = MDTMParser().read(sample_interleaved)
+    with pytest.raises(ValueError):
+        parser(uri='uri1')
+    assert len(parser(uri='uri2')) == 2
+    assert len(parser(uri='uri3')) == 0
+
+    assert parser.uris is parser.uris
+
+    # indexes are updated when reading another file
+    parser.read(sample)
+    assert parser.uris == ('uri1', )
+    assert len(parser(uri='uri1')) == 3
+    assert len(parser(uri='uri2')) == 0
+
+
+def test_batch(sample_interleaved):
+    parser = MDTMParser().read(sample_interleaved)
+    uris = ['uri2', 'uri3', 'uri1', 'uri4']
+    annotations = parser.batch(uris, modality='speaker')
+    assert annotations == [parser(uri=uri, modality='speaker')
+                           for uri in uris]
+    assert annotations[1] is not annotations[3]
+    annotations = parser.batch(uris, modality='speaker', shared_empty=True)
+    assert annotations[1] is annotations[3]
+    assert dict(parser.items()) == {
+        key: parser(uri=key[0], modality=key[1]) for key in parser._loaded}
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_extend(sample, sample_interleaved, lazy):
+    parser = MDTMParser().read(sample, lazy=lazy)
+    speech1 = parser(uri='uri1', modality='speech')
+    parser.extend(sample_interleaved)
+    assert parser.uris == ('uri1', 'uri2')
+    assert parser.modalities == ('speaker', 'speech')
+
+    # already built annotations are updated in place
+    assert parser(uri='uri1', modality='speech') is speech1
+    # track numbers do not collide with those of the first file
+    assert list(speech1.itertracks(yield_label=True)) == [
+        (Segment(1, 3.5), 0, 'alice'),
+        (Segment(1, 3.5), 3, 'alice'),
+        (Segment(3, 7.5), 1, 'barbara'),
+        (Segment(6, 9), 2, 'chris')]
+    assert list(parser(uri='uri2', modality='speaker').itertracks(
+        yield_label=True)) == [(Segment(3, 7.5), 4, 'barbara'),
+                               (Segment(8, 9), 6, 'chris')]
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_follow(sample, lazy):
+    parser = MDTMParser().follow(sample, lazy=lazy)
+    speech1 = parser(uri='uri1', modality='speech')
+    assert len(speech1) == 3
+
+    deltas = []
+    parser.subscribe(lambda uri, modality, delta: deltas.append(
+        (uri, modality, len(delta))))
+
+    with open(sample, 'a') as f:
+        f.write('uri1 channel 10.0 1.0 speech 0.9 female alice\n')
+        f.write('uri2 channel 10.0 1.0 speaker 0.9 female alice\n')
+        f.write('uri2 channel 12.0 1.0 speaker')
+    parser.poll()
+    assert sorted(deltas) == [('uri1', 'speech', 1), ('uri2', 'speaker', 1)]
+    assert parser(uri='uri1', modality='speech') is speech1
+    assert list(speech1.itertracks(yield_label=True))[-1] == \
+        (Segment(10, 11), 3, 'alice')
+
+    # incomplete lines are parsed once complete
+    assert parser.poll() == {}
+    with open(sample, 'a') as f:
+        f.write(' 0.9 male bob\n')
+    assert len(parser.poll()[('uri2', 'speaker')]) == 1
+    assert len(parser(uri='uri2', modality='speaker')) == 2
+
+    # comments only
+    with open(sample, 'a') as f:
+        f.write(';; comment\n')
+    assert type(parser.poll()) is dict
+
+
+def test_write():
+    annotation = Annotation(uri='uri1', modality='speaker')
+    annotation[Segment(6, 9), 'b'] = 'chris'
+    annotation[Segment(1, 3.5), 0] = 'alice'
+    annotation[Segment(6, 9), 'a'] = 'barbara'
+    f = io.StringIO()
+    MDTMParser().write(annotation, f)
+    assert f.getvalue() == ''.join(
+        'uri1 1 %g %g speaker NA %s %s\n' % (
+            segment.start, segment.duration, track, label)
+        for segment, track, label in annotation.itertracks(yield_label=True))
+    assert f.getvalue().splitlines()[1] == \
+        'uri1 1 6 3 speaker NA a barbara'
+
+    f = io.StringIO()
+    REPEREParser().write(annotation, f)
+    assert f.getvalue() == ''.join(
+        'uri1 %g %g speaker %s\n' % (segment.start, segment.end, label)
+        for segment, _, label in annotation.itertracks(yield_label=True))
+
+    timeline = annotation.get_timeline()
+    f = io.StringIO()
+    UEMParser().write(timeline, f)
+    assert f.getvalue() == 'uri1 1 1 3.5\nuri1 1 6 9\n'
+
+
+def test_open_writer(sample):
+    parser = MDTMParser().read(sample)
+    annotation = parser(uri='uri1', modality='speech')
+    expected = io.StringIO()
+    parser.write(annotation, expected)
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'sample.mdtm.gz')
+    with parser.open_writer(path, buffer_size=10) as writer:
+        writer.write(annotation)
+        writer.write_columns({'start': [1, 2.5], 'end': [2, 3],
+                              'label': ['alice', 'bob']},
+                             uri='uri2', modality='speaker')
+    with gzip.open(path, 'rt') as f:
+        assert f.read() == expected.getvalue() + \
+            'uri2 1 1 1 speaker NA NA alice\n' \
+            'uri2 1 2.5 0.5 speaker NA NA bob\n'
+    shutil.rmtree(directory)